@@ -6,18 +6,24 @@ import subprocess
 import sys
 import csv
 import random
+import functools
 import sqlite3
+import threading
 import platform
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
-from PyQt6.QtCore import Qt, QDateTime, QDate, QPoint, QTimer, QSettings
+from PyQt6.QtCore import (
+    Qt, QDateTime, QDate, QPoint, QPointF, QTimer, QTimeZone, QSettings, QAbstractTableModel, QModelIndex
+)
 from PyQt6.QtGui import (
     QColor, QDoubleValidator, QPainter, QPen, 
-    QPixmap, QPolygon, QIcon, QCursor
+    QPixmap, QPolygon, QIcon, QCursor, QFont, QFontMetrics, QBrush, QOpenGLContext
 )
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem, QTableView,
     QHeaderView, QMessageBox, QTabWidget, QDateEdit, QComboBox,
     QDialog, QDialogButtonBox, QGraphicsSimpleTextItem
 )
@@ -27,17 +33,240 @@ from PyQt6.QtCharts import (
 )
 
 
+# Shared SQL text so sqlite3's per-connection statement cache gets hits
+_SQL_LIST_ANIMALS = "SELECT id, name FROM animals"
+_SQL_LIST_ANIMAL_DETAILS = "SELECT id, name, animal_type, birthdate FROM animals"
+_SQL_CREATE_MEAL_INDEX = "CREATE INDEX IF NOT EXISTS idx_meals ON diet_logs(animal_id, timestamp)"
+# Serves the daily-nutrition GROUP BY in index order, see _ensure_meal_day_column
+_SQL_CREATE_MEAL_DAY_INDEX = "CREATE INDEX IF NOT EXISTS idx_meals_day ON diet_logs(animal_id, day, amount)"
+_SQL_INSERT_ANIMAL = "INSERT INTO animals (name, animal_type, birthdate) VALUES (?, ?, ?)"
+# *_PREFIX forms end in "VALUES " for KittenDatabase._chunked_insert
+_SQL_INSERT_WEIGHT_PREFIX = "INSERT INTO weight_data (animal_id, date, weight, notes) VALUES "
+_SQL_INSERT_WEIGHT = _SQL_INSERT_WEIGHT_PREFIX + "(?, ?, ?, ?)"
+_SQL_INSERT_MEAL_PREFIX = (
+    "INSERT INTO diet_logs (animal_id, timestamp, meal_type, food_item, brand, amount, notes) VALUES "
+)
+_SQL_INSERT_MEAL = _SQL_INSERT_MEAL_PREFIX + "(?, ?, ?, ?, ?, ?, ?)"
+_SQL_WEIGHT_DATA = "SELECT date, weight, notes FROM weight_data WHERE animal_id=? ORDER BY date"
+_SQL_WEIGHT_DATA_SINCE = (
+    "SELECT date, weight, notes FROM weight_data WHERE animal_id=? AND date>? ORDER BY date"
+)
+# Latest weight and the last one at least 7 days before it; two primary-key seeks
+_SQL_WEIGHT_STATS = """
+    WITH latest AS (
+        SELECT date, weight FROM weight_data WHERE animal_id=? ORDER BY date DESC LIMIT 1
+    )
+    SELECT latest.weight, (
+        SELECT weight FROM weight_data
+        WHERE animal_id=? AND date <= date(latest.date, '-7 days')
+        ORDER BY date DESC LIMIT 1
+    )
+    FROM latest
+"""
+_SQL_DAILY_NUTRITION = """
+    SELECT day, SUM(amount)
+    FROM diet_logs
+    WHERE animal_id=?
+    GROUP BY day
+    ORDER BY day
+"""
+_SQL_DIET_LOGS = (
+    "SELECT timestamp, meal_type, food_item, brand, amount, notes "
+    "FROM diet_logs WHERE animal_id=? ORDER BY timestamp"
+)
+
+# Display factor applied to stored kilograms
+_UNIT_SCALE = {"kg": 1.0, "lbs": 2.20462}
+
+# animal_combo item roles holding animal details next to the id in UserRole
+_ANIMAL_TYPE_ROLE = Qt.ItemDataRole.UserRole + 1
+_ANIMAL_BIRTHDATE_ROLE = Qt.ItemDataRole.UserRole + 2
+
+# Main window tabs (by objectName) that load lazily when first shown
+_TAB_KEYS = {"DashboardTab": "dash", "WeightTab": "weight", "DietTab": "diet"}
+# Animals whose dashboard data is kept in _chart_cache
+_CHART_CACHE_SIZE = 4
+
+# Pools for the "Randomize UI" icon and window title
+_ICON_SHAPES = ("circle", "square", "triangle")
+_ICON_EMOJIS = (
+    "😺", "🐾", "🐱", "🎀", "🦴", "🍗", "🐟", "🥛", "🌟", "⚡", "❤️", "🌈", "🍎", "🐭", "🧶", "🎈"
+)
+_TITLE_ADJECTIVES = ("Fluffy", "Playful", "Majestic", "Cuddly", "Adorable")
+_TITLE_NOUNS = ("Companion", "Friend", "Pal", "Buddy", "Maine Coon")
+
+# Meal-type choices per animal_type; anything else gets the default list
+_MEAL_TYPES = {
+    "Cat": ("Wet Food 🐟", "Dry Food 🥣", "Treat 🍗", "Medicine 💊"),
+    "Dog": ("Kibble 🦴", "Raw Meat 🥩", "Dental Chew 🦷", "Puppy Formula"),
+}
+_DEFAULT_MEAL_TYPES = ("Regular Meal", "Special Diet", "Vitamin", "Custom Feed")
+
+_SYSTEM = platform.system()
+
+# File-manager opener, chosen once instead of per click
+if _SYSTEM == "Windows":
+    _open_folder = os.startfile
+elif _SYSTEM == "Darwin":
+    def _open_folder(path):
+        subprocess.run(["open", path])
+else:
+    def _open_folder(path):
+        subprocess.run(["xdg-open", path])
+
+# Test data generation tables
+_WEIGHT_MILESTONES = {
+    30: "First month growth",
+    90: "3-month adolescent surge",
+    180: "6-month teenage phase",
+    270: "9-month young adult",
+    365: "1-year anniversary"
+}
+_WEIGHT_EVENTS = [
+    ("Discovered birds", 0.15),
+    ("New food introduced", 0.1),
+    ("Playtime increase", 0.1),
+    ("Vet visit", 0.05),
+    ("Grooming session", 0.08)
+]
+# Events are checked in order, so each one only fires if all earlier ones missed
+_WEIGHT_EVENT_CUTOFFS = np.cumsum([
+    prob * np.prod([1 - p for _, p in _WEIGHT_EVENTS[:i]])
+    for i, (_, prob) in enumerate(_WEIGHT_EVENTS)
+]).tolist()
+_SEASONS = [
+    ("❄️ Winter", ["Snowy", "Frigid", "Icy", "Crisp"]),
+    ("🌱 Spring", ["Rainy", "Misty", "Sunny", "Breezy"]),
+    ("☀️ Summer", ["Hot", "Humid", "Stormy", "Dry"]),
+    ("🍂 Fall", ["Cool", "Windy", "Foggy", "Chilly"])
+]
+
+
+# ================= TABLE MODELS =================
+class RecordTableModel(QAbstractTableModel):
+    """
+    Read-only model over the row tuples returned by KittenDatabase.
+    Subclasses set `headers` and override format_cell() for display text.
+    """
+    headers = []
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._backgrounds = {}
+        self._sort_column = 0
+        self._sort_order = Qt.SortOrder.DescendingOrder
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._backgrounds = {}
+        self._sort_rows()
+        self.endResetModel()
+
+    def insert_row(self, row):
+        """Inserts one row at its sorted position and returns that position."""
+        column = self._sort_column
+        key = (row[column] is None, row[column])
+        if self._sort_order == Qt.SortOrder.DescendingOrder:
+            goes_before = lambda other: key > (other[column] is None, other[column])
+        else:
+            goes_before = lambda other: key < (other[column] is None, other[column])
+        # goes_before is False then True along the sorted rows: binary search
+        lo, hi = 0, len(self._rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if goes_before(self._rows[mid]):
+                hi = mid
+            else:
+                lo = mid + 1
+        position = lo
+
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.insert(position, row)
+        # Row highlights are keyed by position, which just shifted
+        self._backgrounds = {}
+        self.endInsertRows()
+        return position
 
-# ================= TABLE ITEMS =================
-class DateTimeTableWidgetItem(QTableWidgetItem):
-    def __init__(self, text):
-        super().__init__(text)
-        self.sort_value = QDateTime.fromString(text, "yyyy-MM-dd HH:mm:ss")
-        if not self.sort_value.isValid():
-            self.sort_value = QDateTime.fromString(text, "yyyy-MM-dd")
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
 
-    def __lt__(self, other):
-        return self.sort_value < other.sort_value
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            value = self._rows[index.row()][index.column()]
+            return "" if value is None else self.format_cell(index.column(), value)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._backgrounds.get(index.row())
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def format_cell(self, column, value):
+        return str(value)
+
+    def set_row_background(self, row, brush):
+        # One dataChanged for the whole row, so the view repaints it once
+        if brush is None:
+            self._backgrounds.pop(row, None)
+        else:
+            self._backgrounds[row] = brush
+        self.dataChanged.emit(
+            self.index(row, 0), self.index(row, self.columnCount() - 1),
+            [Qt.ItemDataRole.BackgroundRole]
+        )
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self.layoutAboutToBeChanged.emit()
+        old_persistent = self.persistentIndexList()
+        new_rows = self._sort_rows()
+        self.changePersistentIndexList(
+            old_persistent,
+            [self.index(new_rows[idx.row()], idx.column()) for idx in old_persistent]
+        )
+        self.layoutChanged.emit()
+
+    def _sort_rows(self):
+        """Sorts in place and returns a map of old row -> new row."""
+        column = self._sort_column
+        values = [row[column] for row in self._rows]
+        missing = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+        if missing.any():
+            present = values[int(np.argmin(missing))] if not missing.all() else ""
+            fill = type(present)()
+            values = [fill if v is None else v for v in values]
+
+        # One C-level argsort over the column; empty cells sort after values
+        order = np.lexsort((np.array(values), missing))
+        if self._sort_order == Qt.SortOrder.DescendingOrder:
+            order = order[::-1]
+        order = order.tolist()
+        self._rows = [self._rows[r] for r in order]
+        return {old: new for new, old in enumerate(order)}
+
+
+class WeightTableModel(RecordTableModel):
+    headers = ["Date", "Weight", "Notes"]
+
+    def format_cell(self, column, value):
+        return f"{value:.2f}" if column == 1 else str(value)
+
+
+class DietTableModel(RecordTableModel):
+    headers = ["Timestamp", "Meal Type", "Food", "Brand", "Amount (g)", "Notes"]
+
+    def format_cell(self, column, value):
+        return f"{value:.1f} g" if column == 4 else str(value)
 
 
 
@@ -46,9 +275,9 @@ class KittenDatabase:
     def __init__(self, production=True):
         self.production = production
         try:
-            if platform.system() == "Windows":
+            if _SYSTEM == "Windows":
                 app_data = Path.home() / "AppData" / "Local" / "KittenTracker"
-            elif platform.system() == "Darwin":
+            elif _SYSTEM == "Darwin":
                 app_data = Path.home() / "Library" / "Application Support" / "KittenTracker"
             else:
                 app_data = Path.home() / ".local" / "share" / "KittenTracker"
@@ -59,55 +288,195 @@ class KittenDatabase:
             self.backup_dir = app_data / "backups"
             self.backup_dir.mkdir(exist_ok=True)
 
-            self.conn = sqlite3.connect(self.db_path)
-            self._exec("PRAGMA foreign_keys = ON;")
+            self._in_transaction = False
+            self._connect()
             self._create_tables()
             self._migrate_old_data()
             self._migrate_schema()
+            if self._wal:
+                self._start_checkpointer()
         except Exception as e:
             QMessageBox.critical(None, "Fatal Error", f"Failed to initialize database: {str(e)}")
             sys.exit(1)
 
+    def _connect(self):
+        # Autocommit at the driver level; multi-statement writes go through transaction()
+        self.conn = sqlite3.connect(self.db_path, isolation_level=None, cached_statements=256)
+        self.conn.row_factory = sqlite3.Row
+        # Reused statement handles: one for writes, one for fetchall() reads.
+        # Streaming readers such as iter_weight_data get their own cursor.
+        self._write_cursor = self.conn.cursor()
+        self._read_cursor = self.conn.cursor()
+        self._exec("PRAGMA foreign_keys = ON;")
+
+        # WAL turns each commit into a log append instead of a full journal sync.
+        # The mode is stored in the database file, so only switch when needed;
+        # the remaining pragmas are per-connection and are set on every open.
+        mode = self.conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if mode.lower() != "wal":
+            try:
+                mode = self.conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            except sqlite3.OperationalError as e:
+                # Read-only or locked database: keep the current journal mode
+                print(f"WAL switch failed: {str(e)}")
+            if mode.lower() != "wal":
+                print(f"WAL unavailable, using journal_mode={mode}")
+        self._wal = mode.lower() == "wal"
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-65536")
+        self.conn.execute("PRAGMA mmap_size=268435456")
+        # Checkpoints normally run on the background connection, see
+        # _start_checkpointer; the autocheckpoint stays as a safety net in case
+        # that thread is not running. Once the log has been checkpointed, shrink
+        # it back to 4 MB at most instead of leaving it at the largest batch.
+        self.conn.execute("PRAGMA wal_autocheckpoint=1000")
+        self.conn.execute("PRAGMA journal_size_limit=4194304")
+
+    def _start_checkpointer(self, interval=5.0):
+        """
+        With WAL and synchronous=NORMAL a commit is just a log append; the only
+        fsync left is copying the log back into the database. That runs here, on
+        a second connection in a background thread, instead of inside whichever
+        GUI-thread commit happens to cross the autocheckpoint threshold.
+        If the thread stops, the wal_autocheckpoint set in _connect still bounds the log.
+        """
+        self._checkpoint_stop = threading.Event()
+
+        def run():
+            try:
+                conn = sqlite3.connect(self.db_path)
+            except sqlite3.Error as e:
+                print(f"WAL checkpointer not started: {str(e)}")
+                return
+            try:
+                while not self._checkpoint_stop.wait(interval):
+                    try:
+                        conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                    except sqlite3.Error as e:
+                        print(f"WAL checkpoint failed, leaving it to autocheckpoint: {str(e)}")
+                        return
+            finally:
+                conn.close()
+
+        self._checkpointer = threading.Thread(target=run, name="wal-checkpoint", daemon=True)
+        self._checkpointer.start()
+
+    def close(self):
+        if self._wal:
+            self._checkpoint_stop.set()
+            self._checkpointer.join()
+        self.conn.close()
+
     def _exec(self, query, params=()):
+        # Outside transaction() a single statement is its own atomic commit
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(query, params)
-            self.conn.commit()
+            self._write_cursor.execute(query, params)
             return True
         except sqlite3.Error as e:
-            self.conn.rollback()
+            if self._in_transaction:
+                # Let transaction() roll back the whole batch
+                raise
             QMessageBox.warning(None, "Database Error", f"Operation failed: {str(e)}")
             return False
 
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several writes into one commit. Yields a cursor; _exec calls made
+        inside the block join the transaction. Rolls back and re-raises on error.
+        Nested blocks join the outer transaction.
+        """
+        if self._in_transaction:
+            yield self._write_cursor
+            return
+
+        # IMMEDIATE takes the write lock up front instead of upgrading mid-batch
+        self._write_cursor.execute("BEGIN IMMEDIATE")
+        self._in_transaction = True
+        try:
+            # Writes never iterate results, so the block shares _exec's cursor
+            yield self._write_cursor
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            raise
+        finally:
+            self._in_transaction = False
+
+    def executemany(self, query, rows):
+        with self.transaction() as cursor:
+            cursor.executemany(query, rows)
+
+    def _chunked_insert(self, cursor, sql_prefix, cols, rows, chunk=100):
+        """
+        Inserts rows with multi-row VALUES statements of up to `chunk` rows,
+        so the statement overhead is paid once per chunk instead of per row.
+        sql_prefix ends with "VALUES "; the caller owns the transaction.
+        """
+        group = "(" + ", ".join("?" * cols) + ")"
+        if len(rows) < chunk:
+            cursor.executemany(sql_prefix + group, rows)
+            return
+
+        full_sql = sql_prefix + ", ".join([group] * chunk)
+        for start in range(0, len(rows), chunk):
+            batch = rows[start:start + chunk]
+            sql = full_sql if len(batch) == chunk else sql_prefix + ", ".join([group] * len(batch))
+            cursor.execute(sql, [value for row in batch for value in row])
+
     def _create_tables(self):
-        self._exec("""
-            CREATE TABLE IF NOT EXISTS animals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                animal_type TEXT,
-                birthdate DATE
-            )
-        """)
-        self._exec("""
-            CREATE TABLE IF NOT EXISTS weight_data (
-                animal_id INTEGER REFERENCES animals(id) ON DELETE CASCADE,
-                date DATE NOT NULL,
-                weight REAL NOT NULL,
-                notes TEXT,
-                UNIQUE(animal_id, date)
-            )
-        """)
-        self._exec("""
-            CREATE TABLE IF NOT EXISTS diet_logs (
-                animal_id INTEGER REFERENCES animals(id) ON DELETE CASCADE,
-                timestamp DATETIME NOT NULL,
-                meal_type TEXT,
-                food_item TEXT,
-                brand TEXT,
-                amount REAL,
-                notes TEXT
-            )
-        """)
+        # A fresh database gets its whole schema in one commit
+        with self.transaction():
+            self._exec("""
+                CREATE TABLE IF NOT EXISTS animals (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    animal_type TEXT,
+                    birthdate DATE
+                )
+            """)
+            # Dates stay ISO-8601 text: fixed-width strings order the same as the
+            # dates they spell, so keys and ORDER BY need no conversion, and the
+            # charts turn them into day numbers in one numpy cast.
+            self._exec("""
+                CREATE TABLE IF NOT EXISTS weight_data (
+                    animal_id INTEGER REFERENCES animals(id) ON DELETE CASCADE,
+                    date DATE NOT NULL,
+                    weight REAL NOT NULL,
+                    notes TEXT,
+                    PRIMARY KEY(animal_id, date)
+                ) WITHOUT ROWID
+            """)
+            self._exec("""
+                CREATE TABLE IF NOT EXISTS diet_logs (
+                    animal_id INTEGER REFERENCES animals(id) ON DELETE CASCADE,
+                    timestamp DATETIME NOT NULL,
+                    meal_type TEXT,
+                    food_item TEXT,
+                    brand TEXT,
+                    amount REAL,
+                    notes TEXT
+                )
+            """)
+            self._exec(_SQL_CREATE_MEAL_INDEX)
+            self._ensure_meal_day_column()
+            self._exec(_SQL_CREATE_MEAL_DAY_INDEX)
+
+    def _ensure_meal_day_column(self):
+        """
+        diet_logs.day is the date part of timestamp as a virtual generated
+        column, so daily totals group on an indexed column instead of DATE().
+        """
+        columns = [col[1] for col in self.conn.execute("PRAGMA table_xinfo(diet_logs)")]
+        if "day" in columns:
+            return
+        # Earlier builds indexed the substr() expression under the same name
+        self._exec("DROP INDEX IF EXISTS idx_meals_day")
+        self._exec(
+            "ALTER TABLE diet_logs ADD COLUMN day TEXT "
+            "GENERATED ALWAYS AS (substr(timestamp, 1, 10)) VIRTUAL"
+        )
 
     def _migrate_old_data(self):
         old_path = Path("kitten_tracker.db")
@@ -115,11 +484,10 @@ class KittenDatabase:
             try:
                 old_conn = sqlite3.connect(old_path)
                 old_data = old_conn.execute("SELECT * FROM animals").fetchall()
-                for row in old_data:
-                    self._exec(
-                        "INSERT INTO animals (name, animal_type, birthdate) VALUES (?, ?, ?)",
-                        (row[1], row[2], row[3])
-                    )
+                self.executemany(
+                    _SQL_INSERT_ANIMAL,
+                    [(row[1], row[2], row[3]) for row in old_data]
+                )
                 old_path.unlink()
             except Exception as e:
                 print(f"Migration failed: {str(e)}")
@@ -134,63 +502,138 @@ class KittenDatabase:
         if 'brand' not in columns:
             self._exec("ALTER TABLE diet_logs ADD COLUMN brand TEXT")
 
+        # Older databases stored weight_data as a rowid table with a separate
+        # UNIQUE(animal_id, date) index; rebuild it clustered on that key.
+        row = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='weight_data'"
+        ).fetchone()
+        if row and "WITHOUT ROWID" not in row[0].upper():
+            try:
+                self.conn.executescript("""
+                    BEGIN;
+                    CREATE TABLE weight_data_new (
+                        animal_id INTEGER REFERENCES animals(id) ON DELETE CASCADE,
+                        date DATE NOT NULL,
+                        weight REAL NOT NULL,
+                        notes TEXT,
+                        PRIMARY KEY(animal_id, date)
+                    ) WITHOUT ROWID;
+                    INSERT OR IGNORE INTO weight_data_new (animal_id, date, weight, notes)
+                        SELECT animal_id, date, weight, notes FROM weight_data
+                        WHERE animal_id IS NOT NULL;
+                    DROP TABLE weight_data;
+                    ALTER TABLE weight_data_new RENAME TO weight_data;
+                    COMMIT;
+                """)
+            except sqlite3.Error as e:
+                self.conn.rollback()
+                print(f"weight_data migration failed: {str(e)}")
+
     def get_data_folder(self):
         return self.db_path.parent
 
+    def add_animal(self, name, animal_type, birthdate):
+        """Returns the new animal's id, or None if the insert failed."""
+        if self._exec(_SQL_INSERT_ANIMAL, (name, animal_type, birthdate)):
+            return self._write_cursor.lastrowid
+        return None
+
     def add_meal(self, animal_id, timestamp, meal_type, food, brand, amount, notes=""):
         return self._exec(
-            "INSERT INTO diet_logs (animal_id, timestamp, meal_type, food_item, brand, amount, notes) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            _SQL_INSERT_MEAL,
             (animal_id, timestamp, meal_type, food, brand, amount, notes)
         )
 
     def add_weight(self, animal_id, date, weight, notes=""):
-        return self._exec(
-            "INSERT INTO weight_data (animal_id, date, weight, notes) VALUES (?, ?, ?, ?)",
-            (animal_id, date, weight, notes)
-        )
+        return self._exec(_SQL_INSERT_WEIGHT, (animal_id, date, weight, notes))
+
+    def add_weights_bulk(self, rows):
+        """Inserts (animal_id, date, weight, notes) rows with a single commit."""
+        with self.transaction() as cursor:
+            self._chunked_insert(cursor, _SQL_INSERT_WEIGHT_PREFIX, 4, rows)
+
+    def add_meals_bulk(self, rows):
+        """Inserts (animal_id, timestamp, meal_type, food, brand, amount, notes) rows with a single commit."""
+        with self.transaction() as cursor:
+            self._chunked_insert(cursor, _SQL_INSERT_MEAL_PREFIX, 7, rows)
+
+    def get_animals(self):
+        return self._read_cursor.execute(_SQL_LIST_ANIMALS).fetchall()
+
+    def get_animal_details(self):
+        return self._read_cursor.execute(_SQL_LIST_ANIMAL_DETAILS).fetchall()
 
     def get_weight_data(self, animal_id):
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT date, weight, notes FROM weight_data WHERE animal_id=? ORDER BY date",
-            (animal_id,)
+        return self._read_cursor.execute(_SQL_WEIGHT_DATA, (animal_id,)).fetchall()
+
+    def get_weight_data_since(self, animal_id, cutoff_date):
+        """Rows strictly after cutoff_date, oldest first."""
+        return self._read_cursor.execute(_SQL_WEIGHT_DATA_SINCE, (animal_id, cutoff_date)).fetchall()
+
+    def get_weight_stats(self, animal_id):
+        """(latest, week_ago) weights; (None, None) without data, week_ago None if no week of history."""
+        row = self._read_cursor.execute(_SQL_WEIGHT_STATS, (animal_id, animal_id)).fetchone()
+        return tuple(row) if row else (None, None)
+
+    def get_dashboard_bundle(self, animal_id):
+        """
+        Returns (weight_data, daily_nutrition, weight_stats) read inside one
+        transaction, so the charts and the stat cards see the same snapshot.
+        """
+        if self._in_transaction:
+            return self._dashboard_reads(animal_id)
+        self._read_cursor.execute("BEGIN")
+        try:
+            return self._dashboard_reads(animal_id)
+        finally:
+            self._read_cursor.execute("COMMIT")
+
+    def _dashboard_reads(self, animal_id):
+        return (
+            self.get_weight_data(animal_id),
+            self.get_daily_nutrition(animal_id),
+            self.get_weight_stats(animal_id)
         )
-        return cursor.fetchall()
 
-    def get_daily_nutrition(self, animal_id):
+    def iter_weight_data(self, animal_id):
+        """Returns the live cursor so callers stream rows; plain tuples, no Row wrapper."""
         cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT DATE(timestamp), SUM(amount)
-            FROM diet_logs
-            WHERE animal_id=?
-            GROUP BY DATE(timestamp)
-            ORDER BY DATE(timestamp)
-        """, (animal_id,))
-        return cursor.fetchall()
+        cursor.row_factory = None
+        return cursor.execute(_SQL_WEIGHT_DATA, (animal_id,))
+
+    def get_daily_nutrition(self, animal_id):
+        return self._read_cursor.execute(_SQL_DAILY_NUTRITION, (animal_id,)).fetchall()
 
     def get_diet_logs(self, animal_id):
-        cursor = self.conn.cursor()
-        cursor.execute(
-            "SELECT timestamp, meal_type, food_item, brand, amount, notes "
-            "FROM diet_logs WHERE animal_id=? ORDER BY timestamp",
-            (animal_id,)
-        )
-        return cursor.fetchall()
+        return self._read_cursor.execute(_SQL_DIET_LOGS, (animal_id,)).fetchall()
 
     def clear_test_data(self):
-        self._exec("DELETE FROM animals")
-        self._exec("DELETE FROM weight_data")
-        self._exec("DELETE FROM diet_logs")
+        try:
+            with self.transaction():
+                # Children first: deleting animals first would run the
+                # ON DELETE CASCADE into both tables once per animal row
+                self._exec("DELETE FROM weight_data")
+                self._exec("DELETE FROM diet_logs")
+                self._exec("DELETE FROM animals")
+        except sqlite3.Error as e:
+            if self._in_transaction:
+                # Called inside a caller's transaction(): let it roll back
+                raise
+            QMessageBox.warning(None, "Database Error", f"Operation failed: {str(e)}")
 
     def create_backup(self):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"backup_{timestamp}.db"
         try:
-            self.conn.close()
-            import shutil
-            shutil.copy(self.db_path, backup_path)
-            self.conn = sqlite3.connect(self.db_path)
+            # Online backup reads a consistent snapshot through our connection,
+            # WAL included, without closing it. Truncating the log first keeps
+            # the snapshot to the main file's pages.
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            backup_conn = sqlite3.connect(backup_path)
+            try:
+                self.conn.backup(backup_conn, pages=256)
+            finally:
+                backup_conn.close()
 
             # Instead of a plain info box, show "Open Folder" or "OK"
             box = QMessageBox()
@@ -205,12 +648,7 @@ class KittenDatabase:
 
             if box.clickedButton() == open_folder:
                 # Attempt to open the backups folder
-                if platform.system() == "Windows":
-                    os.startfile(self.backup_dir)
-                elif platform.system() == "Darwin":
-                    subprocess.run(["open", self.backup_dir])
-                else:
-                    subprocess.run(["xdg-open", self.backup_dir])
+                _open_folder(self.backup_dir)
 
         except Exception as e:
             QMessageBox.critical(None, "Backup Failed", f"Error: {str(e)}")
@@ -220,21 +658,99 @@ class KittenDatabase:
 
 
 # ================= CHARTS =================
+def _linfit(x, y):
+    """
+    Least-squares line through (x, y) as (slope, intercept, r). Closed form
+    from centred sums; polyfit's general solver is overkill for degree 1.
+    """
+    dx = x - x.mean()
+    dy = y - y.mean()
+    sxx = dx @ dx
+    sxy = dx @ dy
+    syy = dy @ dy
+    if sxx == 0:
+        return 0.0, float(y.mean()), 0.0
+    slope = sxy / sxx
+    r = sxy / np.sqrt(sxx * syy) if syy else 0.0
+    return slope, y.mean() - slope * x.mean(), r
+
+
+def _m4_indices(x, y, n_bins):
+    """
+    M4 downsampling: indices of the first, last, lowest and highest point in
+    each of n_bins equal-width x buckets, in x order. With one bucket per
+    pixel column the plotted shape is unchanged. x must be sorted.
+    """
+    span = x[-1] - x[0]
+    if span <= 0:
+        return np.arange(len(x))
+    buckets = np.minimum(((x - x[0]) * (n_bins / span)).astype(np.int64), n_bins - 1)
+    firsts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    lasts = np.r_[firsts[1:], len(x)] - 1
+    # Sorting by (bucket, y) puts each bucket's min first and max last
+    by_value = np.lexsort((y, buckets))
+    return np.unique(np.concatenate((firsts, lasts, by_value[firsts], by_value[lasts])))
+
+
+def _scatter_cell_indices(x, y, width, height):
+    """
+    Indices of the first point in each cell of a width x height grid over the
+    data's bounding box, in input order. Points sharing a pixel draw as one
+    marker, so a scatter only needs one of them.
+    """
+    span_x = float(np.ptp(x)) or 1.0
+    span_y = float(np.ptp(y)) or 1.0
+    cells_x = ((x - x.min()) * ((width - 1) / span_x)).astype(np.int64)
+    cells_y = ((y - y.min()) * ((height - 1) / span_y)).astype(np.int64)
+    _, first = np.unique(cells_x * height + cells_y, return_index=True)
+    return np.sort(first)
+
+
+def _local_midnight_ms(days):
+    """
+    Epoch milliseconds of local midnight for each datetime64[D] day, as
+    QDateTime.fromString(day, "yyyy-MM-dd") would give. Offsets come from the
+    local zone's transitions over the range, so days on either side of a DST
+    change each get their own.
+    """
+    utc_ms = days.astype(np.int64) * 86_400_000
+    tz = QTimeZone.systemTimeZone()
+    # A day of margin covers the offset at every local midnight in range
+    start = QDateTime.fromMSecsSinceEpoch(int(utc_ms.min()) - 86_400_000)
+    end = QDateTime.fromMSecsSinceEpoch(int(utc_ms.max()) + 86_400_000)
+    transitions = tz.transitions(start, end) if tz.hasTransitions() else []
+    at = np.array([t.atUtc.toMSecsSinceEpoch() for t in transitions], dtype=np.int64)
+    offsets = np.array(
+        [tz.offsetFromUtc(start)] + [t.offsetFromUtc for t in transitions], dtype=np.int64
+    ) * 1000
+    # Start from the offset at UTC midnight and look it up again at the local
+    # midnight it gives; that settles days where the two straddle a transition.
+    # A third lookup moves midnights skipped by a change at 00:00 forward, as Qt does.
+    local_ms = utc_ms
+    for _ in range(3):
+        local_ms = utc_ms - offsets[np.searchsorted(at, local_ms, side="right")]
+    return local_ms
+
+
 class HealthCorrelationChart(QChart):
+    _POINT_COLOR = QColor("#FFA726")
+    _TREND_PEN = QPen(QColor("#7E57C2"), 2, Qt.PenStyle.DashLine)
+
     def __init__(self):
         super().__init__()
         self.setTheme(QChart.ChartTheme.ChartThemeDark)
         self.setTitle("Nutrition vs Weight Correlation")
+        self.setAnimationOptions(QChart.AnimationOption.NoAnimation)
 
         self.scatter = QScatterSeries()
         self.scatter.setName("Daily Data")
-        self.scatter.setColor(QColor("#FFA726"))
+        self.scatter.setColor(self._POINT_COLOR)
         self.scatter.setMarkerSize(12)
         self.scatter.setBorderColor(QColor(0, 0, 0, 0))
 
         self.trend = QLineSeries()
         self.trend.setName("Trend Line")
-        self.trend.setPen(QPen(QColor("#7E57C2"), 2, Qt.PenStyle.DashLine))
+        self.trend.setPen(self._TREND_PEN)
 
         self.addSeries(self.scatter)
         self.addSeries(self.trend)
@@ -253,8 +769,14 @@ class HealthCorrelationChart(QChart):
         self.scatter.attachAxis(self.y_axis)
         self.trend.attachAxis(self.x_axis)
         self.trend.attachAxis(self.y_axis)
+        self._last_data = (None, None)
 
     def update_chart(self, nutrition_data, weight_data):
+        # Cached dashboard data comes back as the same list objects
+        if nutrition_data is self._last_data[0] and weight_data is self._last_data[1]:
+            return
+        self._last_data = (nutrition_data, weight_data)
+
         self.scatter.clear()
         self.trend.clear()
 
@@ -263,47 +785,56 @@ class HealthCorrelationChart(QChart):
             self.y_axis.setRange(-5, 5)
             return
 
-        dates = [datetime.strptime(d[0], "%Y-%m-%d") for d in weight_data]
-        weights = [d[1] for d in weight_data]
+        # Dates become integer day numbers once, so matching is integer compares
+        days = np.fromiter(
+            (row[0] for row in weight_data), dtype="datetime64[D]", count=len(weight_data)
+        ).astype(np.int64)
+        weights = np.fromiter((row[1] for row in weight_data), dtype=np.float64, count=len(weight_data))
 
-        weight_changes = {}
-        for i in range(1, len(dates)):
-            days_between = (dates[i] - dates[i - 1]).days
-            if days_between == 0:
-                continue
-            daily_change = (weights[i] - weights[i - 1]) / weights[i - 1] / days_between
-            for d in range(days_between):
-                current_date = dates[i - 1] + timedelta(days=d)
-                weight_changes[current_date] = daily_change * 100
-
-        plot_data = []
-        for nut_date_str, nut_total in nutrition_data:
-            nut_date = datetime.strptime(nut_date_str, "%Y-%m-%d")
-            if nut_date in weight_changes:
-                plot_data.append((float(nut_total), weight_changes[nut_date]))
-
-        if not plot_data:
+        gaps = np.diff(days)
+        keep = gaps != 0
+        gaps = gaps[keep]
+        daily_change = (np.diff(weights) / weights[:-1])[keep] / gaps * 100
+
+        # Spread each interval's daily change over the days it covers
+        change_days = np.repeat(days[:-1][keep], gaps) + (
+            np.arange(gaps.sum()) - np.repeat(np.cumsum(gaps) - gaps, gaps)
+        )
+        changes = np.repeat(daily_change, gaps)
+
+        nut_days = np.fromiter(
+            (row[0] for row in nutrition_data), dtype="datetime64[D]", count=len(nutrition_data)
+        ).astype(np.int64)
+        nut_totals = np.fromiter((row[1] for row in nutrition_data), dtype=np.float64, count=len(nutrition_data))
+        idx = np.searchsorted(change_days, nut_days).clip(max=max(len(change_days) - 1, 0))
+        matched = (change_days[idx] == nut_days) if len(change_days) else np.zeros(len(nut_days), dtype=bool)
+
+        if not matched.any():
             return
 
-        x_vals = [p[0] for p in plot_data]
-        y_vals = [p[1] for p in plot_data]
+        x_vals = nut_totals[matched]
+        y_vals = changes[idx[matched]]
 
-        for x, y in plot_data:
-            self.scatter.append(x, y)
+        # Long histories put several days on one pixel; draw one marker per
+        # pixel but keep every point for the fit below
+        plot = self.plotArea()
+        width, height = int(plot.width()) or 800, int(plot.height()) or 600
+        shown = _scatter_cell_indices(x_vals, y_vals, width, height) if len(x_vals) > width else slice(None)
+        self.scatter.replace([QPointF(x, y) for x, y in zip(x_vals[shown].tolist(), y_vals[shown].tolist())])
 
         if len(x_vals) > 1:
-            coeffs = np.polyfit(x_vals, y_vals, 1)
-            trend_func = np.poly1d(coeffs)
-            min_x, max_x = min(x_vals), max(x_vals)
-            self.trend.append(min_x, trend_func(min_x))
-            self.trend.append(max_x, trend_func(max_x))
+            slope, intercept, correlation = _linfit(x_vals, y_vals)
+            min_x, max_x = float(x_vals.min()), float(x_vals.max())
+            min_y, max_y = float(y_vals.min()), float(y_vals.max())
+            self.trend.replace([
+                QPointF(min_x, slope * min_x + intercept), QPointF(max_x, slope * max_x + intercept)
+            ])
 
             x_pad = (max_x - min_x) * 0.1
-            y_pad = (max(y_vals) - min(y_vals)) * 0.2
+            y_pad = (max_y - min_y) * 0.2
             self.x_axis.setRange(min_x - x_pad, max_x + x_pad)
-            self.y_axis.setRange(min(y_vals) - y_pad, max(y_vals) + y_pad)
+            self.y_axis.setRange(min_y - y_pad, max_y + y_pad)
 
-            correlation = np.corrcoef(x_vals, y_vals)[0, 1]
             self.setTitle(f"Nutrition vs Weight Change (r = {correlation:.2f})")
 
 class MedicationTab(QWidget):
@@ -387,13 +918,16 @@ class MedicationTab(QWidget):
             )
         """
         self.db._exec(create_query)
+        # Serves the per-animal list ordered by start date without a sort step
+        self.db._exec(
+            "CREATE INDEX IF NOT EXISTS idx_medications ON medications(animal_id, start_date)"
+        )
 
     def refresh_animals(self):
         self.animal_combo.clear()
-        rows = self.db.conn.cursor().execute("SELECT id, name FROM animals").fetchall()
-        for animal_id, name in rows:
+        for animal_id, name in self.db.get_animals():
             self.animal_combo.addItem(name, animal_id)
-        if rows:
+        if self.animal_combo.count():
             self.animal_combo.setCurrentIndex(0)
             self.load_medications()
 
@@ -443,36 +977,40 @@ class MedicationTab(QWidget):
             self.med_table.setRowCount(0)
             return
 
-        cursor = self.db.conn.cursor()
-        rows = cursor.execute("""
+        rows = self.db.conn.execute("""
             SELECT id, med_name, start_date, frequency, notes
             FROM medications
             WHERE animal_id=?
             ORDER BY start_date DESC
         """, (animal_id,)).fetchall()
 
-        self.med_table.setRowCount(0)
-        for row_idx, (record_id, med_name, start_date, frequency, notes) in enumerate(rows):
-            self.med_table.insertRow(row_idx)
-
-            self.med_table.setItem(row_idx, 0, QTableWidgetItem(med_name))
-            self.med_table.setItem(row_idx, 1, QTableWidgetItem(str(start_date)))
-            self.med_table.setItem(row_idx, 2, QTableWidgetItem(frequency))
-            self.med_table.setItem(row_idx, 3, QTableWidgetItem(notes))
-
-            # Action cell (delete button)
-            delete_btn = QPushButton("Delete")
-            delete_btn.setStyleSheet("background: #F44336; color: white;")
-            delete_btn.clicked.connect(lambda _, rid=record_id: self.delete_medication(rid))
-
-            cell_widget = QWidget()
-            cell_layout = QHBoxLayout(cell_widget)
-            cell_layout.setContentsMargins(0, 0, 0, 0)
-            cell_layout.addWidget(delete_btn)
-            cell_layout.addStretch()
-            cell_widget.setLayout(cell_layout)
-
-            self.med_table.setCellWidget(row_idx, 4, cell_widget)
+        # One repaint after all rows and their delete buttons exist
+        self.med_table.setUpdatesEnabled(False)
+        try:
+            # Drop the old items, then size the table once for the new rows
+            self.med_table.setRowCount(0)
+            self.med_table.setRowCount(len(rows))
+            for row_idx, (record_id, med_name, start_date, frequency, notes) in enumerate(rows):
+                self.med_table.setItem(row_idx, 0, QTableWidgetItem(med_name))
+                self.med_table.setItem(row_idx, 1, QTableWidgetItem(str(start_date)))
+                self.med_table.setItem(row_idx, 2, QTableWidgetItem(frequency))
+                self.med_table.setItem(row_idx, 3, QTableWidgetItem(notes))
+
+                # Action cell (delete button)
+                delete_btn = QPushButton("Delete")
+                delete_btn.setStyleSheet("background: #F44336; color: white;")
+                delete_btn.clicked.connect(lambda _, rid=record_id: self.delete_medication(rid))
+
+                cell_widget = QWidget()
+                cell_layout = QHBoxLayout(cell_widget)
+                cell_layout.setContentsMargins(0, 0, 0, 0)
+                cell_layout.addWidget(delete_btn)
+                cell_layout.addStretch()
+                cell_widget.setLayout(cell_layout)
+
+                self.med_table.setCellWidget(row_idx, 4, cell_widget)
+        finally:
+            self.med_table.setUpdatesEnabled(True)
 
     def delete_medication(self, record_id):
         confirm = QMessageBox.question(
@@ -563,13 +1101,15 @@ class VaccinationTab(QWidget):
             )
         """
         self.db._exec(create_query)
+        self.db._exec(
+            "CREATE INDEX IF NOT EXISTS idx_vaccinations ON vaccinations(animal_id, date_admin)"
+        )
 
     def refresh_animals(self):
         self.animal_combo.clear()
-        rows = self.db.conn.cursor().execute("SELECT id, name FROM animals").fetchall()
-        for animal_id, name in rows:
+        for animal_id, name in self.db.get_animals():
             self.animal_combo.addItem(name, animal_id)
-        if rows:
+        if self.animal_combo.count():
             self.animal_combo.setCurrentIndex(0)
             self.load_vaccinations()
 
@@ -612,35 +1152,37 @@ class VaccinationTab(QWidget):
             self.vax_table.setRowCount(0)
             return
 
-        cursor = self.db.conn.cursor()
-        rows = cursor.execute("""
+        rows = self.db.conn.execute("""
             SELECT id, vaccine_name, date_admin, date_due, notes
             FROM vaccinations
             WHERE animal_id=?
             ORDER BY date_admin DESC
         """, (animal_id,)).fetchall()
 
-        self.vax_table.setRowCount(0)
-        for i, (rec_id, name, d_admin, d_due, notes) in enumerate(rows):
-            self.vax_table.insertRow(i)
-
-            self.vax_table.setItem(i, 0, QTableWidgetItem(name))
-            self.vax_table.setItem(i, 1, QTableWidgetItem(d_admin))
-            self.vax_table.setItem(i, 2, QTableWidgetItem(d_due))
-            self.vax_table.setItem(i, 3, QTableWidgetItem(notes))
-
-            # Action cell with delete
-            delete_btn = QPushButton("Delete")
-            delete_btn.setStyleSheet("background: #F44336; color: white;")
-            delete_btn.clicked.connect(lambda _, rid=rec_id: self.delete_vaccination(rid))
-
-            cell_widget = QWidget()
-            cell_layout = QHBoxLayout(cell_widget)
-            cell_layout.setContentsMargins(0, 0, 0, 0)
-            cell_layout.addWidget(delete_btn)
-            cell_layout.addStretch()
-            cell_widget.setLayout(cell_layout)
-            self.vax_table.setCellWidget(i, 4, cell_widget)
+        self.vax_table.setUpdatesEnabled(False)
+        try:
+            self.vax_table.setRowCount(0)
+            self.vax_table.setRowCount(len(rows))
+            for i, (rec_id, name, d_admin, d_due, notes) in enumerate(rows):
+                self.vax_table.setItem(i, 0, QTableWidgetItem(name))
+                self.vax_table.setItem(i, 1, QTableWidgetItem(d_admin))
+                self.vax_table.setItem(i, 2, QTableWidgetItem(d_due))
+                self.vax_table.setItem(i, 3, QTableWidgetItem(notes))
+
+                # Action cell with delete
+                delete_btn = QPushButton("Delete")
+                delete_btn.setStyleSheet("background: #F44336; color: white;")
+                delete_btn.clicked.connect(lambda _, rid=rec_id: self.delete_vaccination(rid))
+
+                cell_widget = QWidget()
+                cell_layout = QHBoxLayout(cell_widget)
+                cell_layout.setContentsMargins(0, 0, 0, 0)
+                cell_layout.addWidget(delete_btn)
+                cell_layout.addStretch()
+                cell_widget.setLayout(cell_layout)
+                self.vax_table.setCellWidget(i, 4, cell_widget)
+        finally:
+            self.vax_table.setUpdatesEnabled(True)
 
     def delete_vaccination(self, rec_id):
         confirm = QMessageBox.question(
@@ -658,20 +1200,34 @@ class VaccinationTab(QWidget):
                 QMessageBox.warning(self, "Error", "Failed to delete record.")
 
 
+@functools.lru_cache(maxsize=1)
+def _opengl_available():
+    """Whether an OpenGL context can be created; without one GL series draw nothing."""
+    return QOpenGLContext().create()
+
+
 class GrowthChart(QChart):
+    _POINT_COLOR = QColor("#4CAF50")
+    _TREND_PEN = QPen(QColor("#26C6DA"), 2, Qt.PenStyle.DashLine)
+    # Past this many markers the scatter is drawn through OpenGL. GL markers
+    # are plain squares and sit above the other chart items, so short
+    # histories keep the raster path.
+    _OPENGL_MIN_POINTS = 1000
+
     def __init__(self):
         super().__init__()
         self.setTheme(QChart.ChartTheme.ChartThemeDark)
         self.setTitle("Weight Growth")
+        self.setAnimationOptions(QChart.AnimationOption.NoAnimation)
 
         self.scatter = QScatterSeries()
         self.scatter.setName("Measurements")
-        self.scatter.setColor(QColor("#4CAF50"))
+        self.scatter.setColor(self._POINT_COLOR)
         self.scatter.setMarkerSize(10)
 
         self.trend = QLineSeries()
         self.trend.setName("Trend Line")
-        self.trend.setPen(QPen(QColor("#26C6DA"), 2, Qt.PenStyle.DashLine))
+        self.trend.setPen(self._TREND_PEN)
 
         self.addSeries(self.scatter)
         self.addSeries(self.trend)
@@ -689,60 +1245,132 @@ class GrowthChart(QChart):
         self.scatter.attachAxis(self.y_axis)
         self.trend.attachAxis(self.x_axis)
         self.trend.attachAxis(self.y_axis)
+        self._last_data = (None, None)
+        # Running least-squares sums over (days since first point, weight)
+        self._fit = None
+        # Unit factor of the points on the chart, set by update_chart
+        self._scale = 1.0
 
     def update_chart(self, data, unit='kg'):
-        self.scatter.clear()
-        self.trend.clear()
+        if data is self._last_data[0] and unit == self._last_data[1]:
+            return
+        self._last_data = (data, unit)
+
+        self._fit = None
 
         if not data:
+            self.scatter.clear()
+            self.trend.clear()
             self.x_axis.setRange(QDateTime.currentDateTime().addMonths(-1), QDateTime.currentDateTime())
             self.y_axis.setRange(0, 10)
             return
 
-        conversion = 2.20462 if unit == 'lbs' else 1
-        x_vals = []
-        y_vals = []
-
-        for date_str, weight, _ in data:
-            dt = QDateTime.fromString(date_str, "yyyy-MM-dd")
-            adj_weight = weight * conversion
-            self.scatter.append(dt.toMSecsSinceEpoch(), adj_weight)
-            x_vals.append(dt.toMSecsSinceEpoch())
-            y_vals.append(adj_weight)
-
-        if len(data) > 1:
-            coeffs = np.polyfit(x_vals, y_vals, 1)
-            trend_func = np.poly1d(coeffs)
-            self.trend.append(
-                QDateTime.fromString(data[0][0], "yyyy-MM-dd").toMSecsSinceEpoch(),
-                trend_func(x_vals[0])
-            )
-            self.trend.append(
-                QDateTime.fromString(data[-1][0], "yyyy-MM-dd").toMSecsSinceEpoch(),
-                trend_func(x_vals[-1])
-            )
+
+        # Parse all dates in one call; datetime64 is UTC, so each day is shifted
+        # to local midnight like QDateTime.fromString would.
+        days = np.fromiter((row[0] for row in data), dtype="datetime64[D]", count=len(data))
+        x_vals = _local_midnight_ms(days)
+        y_vals = np.fromiter((row[1] for row in data), dtype=np.float64, count=len(data))
+        self._scale = scale = _UNIT_SCALE[unit]
+        if scale != 1.0:
+            # kg is the stored unit; only lbs needs the extra pass
+            y_vals *= scale
+
+        # Past ~4 points per pixel column the extra markers only overdraw
+        pixels = int(self.plotArea().width()) or 800
+        shown = _m4_indices(x_vals, y_vals, pixels) if len(data) > 4 * pixels else slice(None)
+        # One replace() copies the whole point list; tolist() hands QPointF
+        # plain floats instead of numpy scalars
+        points = [QPointF(x, y) for x, y in zip(x_vals[shown].tolist(), y_vals[shown].tolist())]
+        self.scatter.setUseOpenGL(len(points) >= self._OPENGL_MIN_POINTS and _opengl_available())
+        self.scatter.replace(points)
+
+        x0 = float(x_vals[0])
+        t = (x_vals - x0) / 86_400_000
+        self._fit = [x0, float(x_vals[-1]), len(data), t.sum(), y_vals.sum(), (t * y_vals).sum(), (t * t).sum()]
+        self._update_trend()
 
         self.y_axis.setTitleText(f'Weight ({unit})')
+        # Rows arrive ORDER BY date, so the x extremes are the ends; the
+        # weights need one min and one max pass over the array
         self.x_axis.setRange(
-            QDateTime.fromString(data[0][0], "yyyy-MM-dd"),
-            QDateTime.fromString(data[-1][0], "yyyy-MM-dd")
+            QDateTime.fromMSecsSinceEpoch(int(x_vals[0])), QDateTime.fromMSecsSinceEpoch(int(x_vals[-1]))
         )
+        low, high = float(y_vals.min()), float(y_vals.max())
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        self.y_axis.setRange(low, high)
         self.y_axis.applyNiceNumbers()
 
+    def append_point(self, data):
+        """
+        Adds data[-1] to a chart currently showing data[:-1]. The trend line is
+        refitted from the running sums, so this is O(1) in the history length.
+        Falls back to a full update_chart when the point is not the newest.
+        """
+        prev, unit = self._last_data
+        if self._fit is None:
+            self.update_chart(data, unit or 'kg')
+            return
+        # Same conversion as update_chart, so a later full rebuild puts this
+        # point in the same place
+        x = int(_local_midnight_ms(np.array([data[-1][0]], dtype="datetime64[D]"))[0])
+        if len(data) < 2 or data[-2] is not prev[-1] or x <= self._fit[1]:
+            self.update_chart(data, unit or 'kg')
+            return
+        self._last_data = (data, unit)
+
+        y = data[-1][1] * self._scale
+        self.scatter.append(x, y)
+
+        t = (x - self._fit[0]) / 86_400_000
+        fit = self._fit
+        fit[1] = x
+        fit[2] += 1
+        fit[3] += t
+        fit[4] += y
+        fit[5] += t * y
+        fit[6] += t * t
+        self._update_trend()
+
+        self.x_axis.setMax(QDateTime.fromMSecsSinceEpoch(x))
+        if not self.y_axis.min() <= y <= self.y_axis.max():
+            self.y_axis.setRange(min(self.y_axis.min(), y), max(self.y_axis.max(), y))
+            self.y_axis.applyNiceNumbers()
+
+    def _update_trend(self):
+        x0, x_last, n, st, sy, sty, stt = self._fit
+        denom = n * stt - st * st
+        if n < 2 or denom == 0:
+            self.trend.clear()
+            return
+        slope = (n * sty - st * sy) / denom
+        intercept = (sy - slope * st) / n
+        t_last = (x_last - x0) / 86_400_000
+        self.trend.replace([QPointF(x0, intercept), QPointF(x_last, intercept + slope * t_last)])
+
         
 
 class NutritionChart(QChart):
+    _BAR_COLOR = QColor("#26C6DA")
+    _GOAL_PEN = QPen(QColor("#FF5252"), 2, Qt.PenStyle.DashLine)
+
     def __init__(self):
         super().__init__()
         self.setTheme(QChart.ChartTheme.ChartThemeDark)
         self.setTitle("Daily Nutrition Intake")
+        self.setAnimationOptions(QChart.AnimationOption.NoAnimation)
 
         self.bars = QBarSeries()
         self.bars.setLabelsVisible(True)
+        # One bar set for the chart's lifetime; updates swap its values
+        self.bar_set = QBarSet("Intake")
+        self.bar_set.setColor(self._BAR_COLOR)
+        self.bars.append(self.bar_set)
         self.addSeries(self.bars)
 
         self.goal_line = QLineSeries()
-        self.goal_line.setPen(QPen(QColor("#FF5252"), 2, Qt.PenStyle.DashLine))
+        self.goal_line.setPen(self._GOAL_PEN)
         self.addSeries(self.goal_line)
 
         self.x_axis = QBarCategoryAxis()
@@ -756,39 +1384,59 @@ class NutritionChart(QChart):
         self.bars.attachAxis(self.y_axis)
         self.goal_line.attachAxis(self.x_axis)
         self.goal_line.attachAxis(self.y_axis)
+        self._last_data = (None, None)
 
     def update_chart(self, data, goal=80):
-        self.bars.clear()
-        self.goal_line.clear()
+        if data is self._last_data[0] and goal == self._last_data[1]:
+            return
+        self._last_data = (data, goal)
+
+        self.bar_set.remove(0, self.bar_set.count())
 
         if not data:
+            self.goal_line.clear()
             self.x_axis.clear()
             self.y_axis.setRange(0, 100)
             return
 
-        bar_set = QBarSet("Intake")
-        bar_set.setColor(QColor("#26C6DA"))
+        categories = [row[0] for row in data]
+        totals = np.fromiter((row[1] for row in data), dtype=np.float64, count=len(data))
+        amounts = np.rint(totals)
+        max_val = max(goal, amounts.max())
 
-        categories = []
-        amounts = []
-        max_val = goal
-
-        for date_str, total in data:
-            categories.append(date_str)
-            clean_total = round(float(total))
-            amounts.append(clean_total)
-            if clean_total > max_val:
-                max_val = clean_total
-
-        bar_set.append(amounts)
-        self.bars.append(bar_set)
+        self.bar_set.append(amounts.tolist())
 
         self.x_axis.setCategories(categories)
         self.y_axis.setRange(0, max_val * 1.2)
 
-        if categories:
-            self.goal_line.append(0, goal)
-            self.goal_line.append(len(categories) - 1, goal)
+        self.goal_line.replace([QPointF(0, goal), QPointF(len(categories) - 1, goal)])
+
+    def append_total(self, data):
+        """
+        Applies a change to the newest day of data, either a larger total for
+        the day already last on the chart or one new day after it, without
+        rebuilding the other bars. Anything else falls back to update_chart.
+        """
+        prev, goal = self._last_data
+        same_day = (
+            prev and len(data) == len(prev) and data[-1][0] == prev[-1][0]
+            and (len(data) < 2 or data[-2] is prev[-2])
+        )
+        new_day = prev and len(data) == len(prev) + 1 and data[-2] is prev[-1]
+        if not (same_day or new_day):
+            self.update_chart(data, 80 if goal is None else goal)
+            return
+        self._last_data = (data, goal)
+
+        amount = float(np.rint(data[-1][1]))
+        if same_day:
+            self.bar_set.replace(len(data) - 1, amount)
+        else:
+            self.bar_set.append(amount)
+            self.x_axis.append(data[-1][0])
+            self.goal_line.replace([QPointF(0, goal), QPointF(len(data) - 1, goal)])
+        if amount * 1.2 > self.y_axis.max():
+            self.y_axis.setRange(0, amount * 1.2)
 
 
 class DatabaseResetHelper:
@@ -804,30 +1452,110 @@ class DatabaseResetHelper:
         KittenDatabase._create_tables(). All data is lost!
         """
         try:
-            cursor = self.db.conn.cursor()
-            cursor.execute("DROP TABLE IF EXISTS diet_logs")
-            cursor.execute("DROP TABLE IF EXISTS weight_data")
-            cursor.execute("DROP TABLE IF EXISTS animals")
-            self.db.conn.commit()
+            with self.db.transaction() as cursor:
+                cursor.execute("DROP TABLE IF EXISTS diet_logs")
+                cursor.execute("DROP TABLE IF EXISTS weight_data")
+                cursor.execute("DROP TABLE IF EXISTS animals")
 
             self.db._create_tables()
             QMessageBox.information(None, "Tables Recreated", 
                 "All tables dropped and recreated successfully!")
         except Exception as e:
-            self.db.conn.rollback()
             QMessageBox.critical(None, "Error", f"Failed to recreate tables: {str(e)}")
 
 
 
+@functools.lru_cache(maxsize=3)
+def _icon_shape_layers(shape):
+    """
+    Returns (fill, outline) pixmaps for a window-icon shape: the fill is
+    plain white so callers can tint it, the outline is the default 1px pen.
+    """
+    layers = []
+    for brush, pen in ((QColor(255, 255, 255), Qt.PenStyle.NoPen), (Qt.BrushStyle.NoBrush, QPen())):
+        pixmap = QPixmap(64, 64)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setBrush(brush)
+        painter.setPen(pen)
+        if shape == "circle":
+            painter.drawEllipse(4, 4, 56, 56)
+        elif shape == "square":
+            painter.drawRoundedRect(4, 4, 56, 56, 12, 12)
+        else:
+            poly = QPolygon([QPoint(32, 8), QPoint(58, 56), QPoint(6, 56)])
+            painter.drawPolygon(poly)
+        painter.end()
+        layers.append(pixmap)
+    return tuple(layers)
+
+
+@functools.lru_cache(maxsize=len(_ICON_EMOJIS))
+def _emoji_glyph(emoji):
+    """
+    Returns (pixmap, ascent) for an icon emoji drawn once in the 24pt icon
+    font, so icons blit it instead of shaping the text on every call.
+    """
+    font = QFont()
+    font.setPointSize(24)
+    metrics = QFontMetrics(font)
+    pixmap = QPixmap(max(metrics.horizontalAdvance(emoji), 1), metrics.height())
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(255, 255, 255))
+    painter.drawText(0, metrics.ascent(), emoji)
+    painter.end()
+    return pixmap, metrics.ascent()
+
+
+def _weight_stats(weight_data):
+    """
+    In-memory twin of KittenDatabase.get_weight_stats for date-sorted rows:
+    the latest weight and the last one at least a week older.
+    """
+    if not weight_data:
+        return None, None
+    latest_date, latest = weight_data[-1][0], weight_data[-1][1]
+    cutoff = QDate.fromString(latest_date, "yyyy-MM-dd").addDays(-7).toString("yyyy-MM-dd")
+    # Dates are unique per animal, so at most seven rows lie past the cutoff
+    for row in reversed(weight_data):
+        if row[0] <= cutoff:
+            return latest, row[1]
+    return latest, None
+
+
 # ================= MAIN APP (PARTIAL) =================
 class KittenTracker(QMainWindow):
+    # Background briefly given to a table row that was just added
+    _FLASH_BRUSH = QBrush(QColor("#4CAF50"))
+
     def __init__(self):
         super().__init__()
         self.production_mode = True
         try:
             self.db = KittenDatabase(production=self.production_mode)
+            # Both connections stay open so toggling dev mode is just a swap
+            self._db_prod = self.db
+            self._db_dev = None
             self.unit = 'kg'
             self.nutrition_goal = 80
+            self._dirty = {"dash": True, "weight": True, "diet": True}
+            self._tab_loaders = {
+                "dash": self.load_dashboard,
+                "weight": self.load_weight_table,
+                "diet": self.load_diet_table
+            }
+            # Animal whose rows each table model currently holds
+            self._table_animal = {"weight": None, "diet": None}
+            # animal_id -> (weight_data, nutrition_data), most recent last
+            self._chart_cache = OrderedDict()
+            # (latest, week_ago) in kg for the animal on the dashboard
+            self._weight_stats = (None, None)
+            # The _MEAL_TYPES entry currently in the meal_type combo
+            self._meal_type_items = None
 
             self.tab_config_path = self.db.get_data_folder() / "tab_order.json"
 
@@ -863,12 +1591,7 @@ class KittenTracker(QMainWindow):
     def open_data_folder(self):
         path = self.db.get_data_folder()
         try:
-            if platform.system() == "Windows":
-                os.startfile(path)
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", path])
-            else:
-                subprocess.run(["xdg-open", path])
+            _open_folder(path)
         except Exception as e:
             QMessageBox.warning(self, "Open Failed", f"Couldn't open folder: {str(e)}")
 
@@ -881,52 +1604,41 @@ class KittenTracker(QMainWindow):
         if confirm == QMessageBox.StandardButton.Yes:
             try:
                 self.db.clear_test_data()
+                self._chart_cache.clear()
                 self.load_data()
                 QMessageBox.information(self, "Success", "All data cleared successfully")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to clear data: {str(e)}")
 
     def generate_random_icon(self):
-        pixmap = QPixmap(64, 64)
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-
         bg_color = QColor(random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
-        painter.setBrush(bg_color)
+        shape = random.choice(_ICON_SHAPES)
+        fill, outline = _icon_shape_layers(shape)
 
-        shape = random.choice(["circle", "square", "triangle"])
-        if shape == "circle":
-            painter.drawEllipse(4, 4, 56, 56)
-        elif shape == "square":
-            painter.drawRoundedRect(4, 4, 56, 56, 12, 12)
-        else:
-            poly = QPolygon([QPoint(32, 8), QPoint(58, 56), QPoint(6, 56)])
-            painter.drawPolygon(poly)
-
-        emojis = random.sample(
-            ["😺", "🐾", "🐱", "🎀", "🦴", "🍗", "🐟", "🥛", "🌟", "⚡", "❤️", "🌈", "🍎", "🐭", "🧶", "🎈"],
-            2
-        )
-        font = painter.font()
-        font.setPointSize(24)
-        painter.setFont(font)
-        painter.setPen(QColor(255, 255, 255))
+        # Tint a copy of the cached white fill, then lay the outline over it
+        pixmap = QPixmap(fill)
+        painter = QPainter(pixmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceIn)
+        painter.fillRect(pixmap.rect(), bg_color)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.drawPixmap(0, 0, outline)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
+        emojis = random.sample(_ICON_EMOJIS, 2)
         for i, emoji in enumerate(emojis):
-            painter.drawText(
+            glyph, ascent = _emoji_glyph(emoji)
+            # Same baseline position the old drawText call used
+            painter.drawPixmap(
                 random.randint(8, 32),
-                random.randint(32, 48) + i * 16,
-                emoji
+                random.randint(32, 48) + i * 16 - ascent,
+                glyph
             )
 
         painter.end()
         return QIcon(pixmap)
 
     def random_window_title(self):
-        adjectives = ["Fluffy", "Playful", "Majestic", "Cuddly", "Adorable"]
-        nouns = ["Companion", "Friend", "Pal", "Buddy", "Maine Coon"]
-        return f"{random.choice(adjectives)} {random.choice(nouns)} Tracker 🐾"
+        return f"{random.choice(_TITLE_ADJECTIVES)} {random.choice(_TITLE_NOUNS)} Tracker 🐾"
 
     def setup_ui(self):
         self.setWindowTitle("Animal Tracker 🐾")
@@ -958,6 +1670,9 @@ class KittenTracker(QMainWindow):
         self.goal_input.setValidator(QDoubleValidator(1, 999, 0))
         self.goal_input.setStyleSheet("background: #333; color: white;")
         self.goal_input.editingFinished.connect(self.update_goal)
+        # Repeated edits within the interval redraw the chart once
+        self._goal_timer = QTimer(self, singleShot=True, interval=250)
+        self._goal_timer.timeout.connect(self._apply_goal)
         goal_layout.addWidget(self.goal_input)
         goal_layout.addWidget(QLabel("grams"))
         stats.addLayout(goal_layout)
@@ -995,7 +1710,8 @@ class KittenTracker(QMainWindow):
         for w in [self.date_input, self.weight_input, self.notes_input, self.add_weight_btn]:
             form.addWidget(w)
 
-        self.weight_table = self._create_table(["Date", "Weight", "Notes"])
+        self.weight_model = WeightTableModel(self)
+        self.weight_table = self._create_table(self.weight_model)
         weight_layout.addLayout(form)
         weight_layout.addWidget(self.weight_table)
         self.tabs.addTab(self.weight_tab, "⚖️ Weight")
@@ -1017,18 +1733,22 @@ class KittenTracker(QMainWindow):
         for w in [self.meal_type, self.food_input, self.brand_input, self.amount_input, self.log_meal_btn]:
             form.addWidget(w)
 
-        self.diet_table = self._create_table(["Timestamp", "Meal Type", "Food", "Brand", "Amount (g)", "Notes"])
+        self.diet_model = DietTableModel(self)
+        self.diet_table = self._create_table(self.diet_model)
         diet_layout.addLayout(form)
         diet_layout.addWidget(self.diet_table)
         self.tabs.addTab(self.diet_tab, "🍴 Meals")
 
+        self.tabs.currentChanged.connect(self._ensure_current_loaded)
+
         status = self.statusBar()
         self.animal_combo = QComboBox()
         self.animal_combo.currentIndexChanged.connect(self.update_meal_types)
+        self.animal_combo.currentIndexChanged.connect(self.load_data)
         self.add_animal_btn = QPushButton("➕ New Animal", clicked=self.add_animal)
         self.unit_btn = QPushButton("Switch to lbs", clicked=self.toggle_units)
         self.export_btn = QPushButton("💾 Export CSV", clicked=self.export_data)
-        self.backup_btn = QPushButton("💾 Backup", clicked=self.db.create_backup)
+        self.backup_btn = QPushButton("💾 Backup", clicked=lambda: self.db.create_backup())
 
         status.addPermanentWidget(QLabel("Current Animal:"))
         status.addPermanentWidget(self.animal_combo)
@@ -1073,28 +1793,26 @@ class KittenTracker(QMainWindow):
             print(f"Could not load tab order: {str(e)}")
             return
 
-        name_to_index = {}
-        for i in range(self.tabs.count()):
-            w = self.tabs.widget(i)
-            name_to_index[w.objectName()] = i
+        widgets_by_name = {
+            self.tabs.widget(i).objectName(): self.tabs.widget(i)
+            for i in range(self.tabs.count())
+        }
 
-        for i, obj_name in enumerate(saved_order):
-            if obj_name not in name_to_index:
+        target = 0
+        for obj_name in saved_order:
+            widget = widgets_by_name.get(obj_name)
+            if widget is None:
                 continue
-            current_index = self.tabs.indexOf(self.tabs.findChild(QWidget, obj_name))
-            if current_index != -1 and current_index != i:
-                self.tabs.tabBar().moveTab(current_index, i)
-
-            name_to_index.clear()
-            for j in range(self.tabs.count()):
-                w = self.tabs.widget(j)
-                name_to_index[w.objectName()] = j
-
-    def _create_table(self, headers):
-        table = QTableWidget()
-        table.setColumnCount(len(headers))
-        table.setHorizontalHeaderLabels(headers)
+            current_index = self.tabs.indexOf(widget)
+            if current_index != -1 and current_index != target:
+                self.tabs.tabBar().moveTab(current_index, target)
+            target += 1
+
+    def _create_table(self, model):
+        table = QTableView()
+        table.setModel(model)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        table.horizontalHeader().setSortIndicator(0, Qt.SortOrder.DescendingOrder)
         table.setStyleSheet("background: #2E2E2E;")
         table.setSortingEnabled(True)
         return table
@@ -1105,81 +1823,113 @@ class KittenTracker(QMainWindow):
         layout.addWidget(QLabel(title, styleSheet="color: rgba(255,255,255,0.8); font-size: 16px;"))
         value_label = QLabel(value, styleSheet="color: white; font-size: 24px; font-weight: bold;")
         layout.addWidget(value_label)
+        # Kept on the card so updates don't walk its layout
+        card.value_label = value_label
         return card
 
     def load_data(self):
-        animal_id = self.current_animal_id()
-        self.weight_table.setUpdatesEnabled(False)
-        self.diet_table.setUpdatesEnabled(False)
-
-        try:
-            self.weight_table.setRowCount(0)
-            self.diet_table.setRowCount(0)
+        """
+        Marks every tab stale and loads only the one currently visible;
+        the others load when they are selected.
+        """
+        self._dirty = {"dash": True, "weight": True, "diet": True}
+        if not self.current_animal_id():
+            self._show_empty_state()
+            return
+        self._ensure_current_loaded()
 
-            if not animal_id:
-                self._show_empty_state()
-                return
+    def _mark_dirty(self, *keys):
+        for key in keys:
+            self._dirty[key] = True
+        self._ensure_current_loaded()
 
-            weight_data = self.db.get_weight_data(animal_id)
-            for date, weight, notes in weight_data:
-                row = self.weight_table.rowCount()
-                self.weight_table.insertRow(row)
-                self.weight_table.setItem(row, 0, DateTimeTableWidgetItem(date))
-                self.weight_table.setItem(row, 1, QTableWidgetItem(f"{weight:.2f}"))
-                self.weight_table.setItem(row, 2, QTableWidgetItem(notes))
-
-            diet_logs = self.db.get_diet_logs(animal_id)
-            for record in diet_logs:
-                # record => (timestamp, meal_type, food_item, brand, amount, notes)
-                row = self.diet_table.rowCount()
-                self.diet_table.insertRow(row)
-                self.diet_table.setItem(row, 0, DateTimeTableWidgetItem(record[0]))
-                self.diet_table.setItem(row, 1, QTableWidgetItem(record[1]))
-                self.diet_table.setItem(row, 2, QTableWidgetItem(record[2]))
-                self.diet_table.setItem(row, 3, QTableWidgetItem(record[3]))
-                self.diet_table.setItem(row, 4, QTableWidgetItem(f"{record[4]:.1f} g"))
-                self.diet_table.setItem(row, 5, QTableWidgetItem(record[5]))
+    def _ensure_current_loaded(self, index=None):
+        animal_id = self.current_animal_id()
+        if not animal_id:
+            return
+        key = _TAB_KEYS.get(self.tabs.currentWidget().objectName())
+        if key and self._dirty.get(key):
+            self._dirty[key] = False
+            self._tab_loaders[key](animal_id)
+
+    def load_weight_table(self, animal_id):
+        # Same query as the growth chart; reuse its rows when the dashboard has them
+        cached = self._chart_cache.get(animal_id)
+        weight_data = cached[0] if cached is not None else self.db.get_weight_data(animal_id)
+        self.weight_model.set_rows(weight_data)
+        self._table_animal["weight"] = animal_id
+
+    def load_diet_table(self, animal_id):
+        self.diet_model.set_rows(self.db.get_diet_logs(animal_id))
+        self._table_animal["diet"] = animal_id
+
+    def _dashboard_data(self, animal_id):
+        cached = self._chart_cache.get(animal_id)
+        if cached is None:
+            cached = (self.db.get_weight_data(animal_id), self.db.get_daily_nutrition(animal_id))
+            self._cache_dashboard_data(animal_id, cached)
+        else:
+            self._chart_cache.move_to_end(animal_id)
+        return cached
+
+    def _cache_dashboard_data(self, animal_id, data):
+        self._chart_cache[animal_id] = data
+        if len(self._chart_cache) > _CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+
+    def load_dashboard(self, animal_id):
+        if animal_id in self._chart_cache:
+            weight_data, nutrition_data = self._dashboard_data(animal_id)
+            # The cached history already holds both card values
+            self._weight_stats = _weight_stats(weight_data)
+        else:
+            # Cold load: all three reads share one round of BEGIN/COMMIT
+            weight_data, nutrition_data, self._weight_stats = self.db.get_dashboard_bundle(animal_id)
+            self._cache_dashboard_data(animal_id, (weight_data, nutrition_data))
 
+        chart_views = [self.growth_chart, self.nutrition_chart, self.health_chart]
+        for view in chart_views:
+            view.setUpdatesEnabled(False)
+        try:
             self.growth_chart.chart().update_chart(weight_data, self.unit)
-            nutrition_data = self.db.get_daily_nutrition(animal_id)
             self.nutrition_chart.chart().update_chart(nutrition_data, self.nutrition_goal)
             self.health_chart.chart().update_chart(nutrition_data, weight_data)
-
-            if weight_data:
-                current_weight = weight_data[-1][1] * (2.20462 if self.unit == 'lbs' else 1)
-                self.current_weight.layout().itemAt(1).widget().setText(f"{current_weight:.2f} {self.unit}")
-
-                if len(weight_data) > 7:
-                    weekly_gain = (weight_data[-1][1] - weight_data[-8][1]) \
-                                  * (2.20462 if self.unit == 'lbs' else 1)
-                    self.weekly_gain.layout().itemAt(1).widget().setText(f"{weekly_gain:+.2f} {self.unit}")
-
-            animal_info = self.db.conn.cursor().execute(
-                "SELECT birthdate FROM animals WHERE id=?", (animal_id,)
-            ).fetchone()
-            if animal_info and animal_info[0]:
-                try:
-                    birthdate = QDate.fromString(animal_info[0], "yyyy-MM-dd")
-                    age_days = birthdate.daysTo(QDate.currentDate())
-                    years = age_days // 365
-                    days = age_days % 365
-                    age_text = f"{years}y {days}d" if years > 0 else f"{days}d"
-                    self.age_card.layout().itemAt(1).widget().setText(age_text)
-                except:
-                    self.age_card.layout().itemAt(1).widget().setText("N/A")
-
         finally:
-            self.weight_table.setUpdatesEnabled(True)
-            self.diet_table.setUpdatesEnabled(True)
-            self.weight_table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
-            self.diet_table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
+            for view in chart_views:
+                view.setUpdatesEnabled(True)
+                view.update()
+
+        self._render_weight_cards()
+
+        birthdate_str = self.animal_combo.currentData(_ANIMAL_BIRTHDATE_ROLE)
+        if birthdate_str:
+            birthdate = QDate.fromString(birthdate_str, "yyyy-MM-dd")
+            if birthdate.isValid():
+                age_days = birthdate.daysTo(QDate.currentDate())
+                years = age_days // 365
+                days = age_days % 365
+                age_text = f"{years}y {days}d" if years > 0 else f"{days}d"
+                self.age_card.value_label.setText(age_text)
+            else:
+                self.age_card.value_label.setText("N/A")
+
+    def _render_weight_cards(self):
+        latest, week_ago = self._weight_stats
+        scale = _UNIT_SCALE[self.unit]
+        current_text = f"{latest * scale:.2f} {self.unit}" if latest is not None else "N/A"
+        self.current_weight.value_label.setText(current_text)
+        if latest is not None and week_ago is not None:
+            gain_text = f"{(latest - week_ago) * scale:+.2f} {self.unit}"
+        else:
+            gain_text = "N/A"
+        self.weekly_gain.value_label.setText(gain_text)
 
     def _show_empty_state(self):
-        self.weight_table.setRowCount(0)
-        self.diet_table.setRowCount(0)
-        self.current_weight.layout().itemAt(1).widget().setText("N/A")
-        self.weekly_gain.layout().itemAt(1).widget().setText("N/A")
-        self.age_card.layout().itemAt(1).widget().setText("N/A")
+        self.weight_model.set_rows([])
+        self.diet_model.set_rows([])
+        self.current_weight.value_label.setText("N/A")
+        self.weekly_gain.value_label.setText("N/A")
+        self.age_card.value_label.setText("N/A")
         self.growth_chart.chart().update_chart([], self.unit)
         self.nutrition_chart.chart().update_chart([], self.nutrition_goal)
         QMessageBox.information(self, "No Animal", "Please select or add an animal to continue")
@@ -1187,7 +1937,18 @@ class KittenTracker(QMainWindow):
     def toggle_units(self):
         self.unit = 'lbs' if self.unit == 'kg' else 'kg'
         self.unit_btn.setText(f"Switch to {'kg' if self.unit == 'lbs' else 'lbs'}")
-        self.load_data()
+        # Tables show stored values; only the growth chart and the weight
+        # cards depend on the unit, and both redraw from data already loaded
+        animal_id = self.current_animal_id()
+        if self._dirty["dash"] or not animal_id:
+            return
+        if self.tabs.currentWidget() is not self.dash_tab:
+            # Hidden: redraw from the cache when the dashboard is next shown
+            self._dirty["dash"] = True
+            return
+        weight_data, _ = self._dashboard_data(animal_id)
+        self.growth_chart.chart().update_chart(weight_data, self.unit)
+        self._render_weight_cards()
 
     def add_weight(self):
         animal_id = self.current_animal_id()
@@ -1201,10 +1962,9 @@ class KittenTracker(QMainWindow):
             notes = self.notes_input.text()
 
             if self.db.add_weight(animal_id, date, weight, notes):
-                self.load_data()
+                self._append_weight_row(animal_id, (date, weight, notes))
                 self.weight_input.clear()
                 self.notes_input.clear()
-                self._flash_table_row(self.weight_table, 0)
             else:
                 QMessageBox.warning(self, "Error", "Duplicate entry for this date!")
         except ValueError:
@@ -1224,37 +1984,90 @@ class KittenTracker(QMainWindow):
             amount = float(self.amount_input.text())
 
             if self.db.add_meal(animal_id, timestamp, meal_type, food, brand, amount):
-                self.load_data()
+                self._append_meal_row(animal_id, (timestamp, meal_type, food, brand, amount, ""))
                 self.food_input.clear()
                 self.brand_input.clear()
                 self.amount_input.clear()
-                self._flash_table_row(self.diet_table, 0)
             else:
                 QMessageBox.warning(self, "Error", "Failed to save meal!")
         except ValueError:
             QMessageBox.warning(self, "Invalid Input", "Enter valid amount")
 
+    def _append_weight_row(self, animal_id, row):
+        """
+        Applies a freshly saved weight to the already-loaded views instead of
+        re-reading the whole history.
+        """
+        cached = self._chart_cache.get(animal_id)
+        if cached is not None:
+            weight_data, nutrition_data = cached
+            if not weight_data or row[0] <= weight_data[-1][0]:
+                # Backdated entry: the chart and trend need a full rebuild
+                self._chart_cache.pop(animal_id)
+            else:
+                weight_data = weight_data + self.db.get_weight_data_since(animal_id, weight_data[-1][0])
+                self._chart_cache[animal_id] = (weight_data, nutrition_data)
+                self.growth_chart.chart().append_point(weight_data)
+        self._dirty["dash"] = True
+
+        if self._dirty["weight"] or self._table_animal["weight"] != animal_id:
+            # The table holds another animal's rows: reload rather than splice
+            self._mark_dirty("weight")
+        else:
+            position = self.weight_model.insert_row(row)
+            self._ensure_current_loaded()
+            self._flash_table_row(self.weight_table, position)
+
+    def _append_meal_row(self, animal_id, row):
+        cached = self._chart_cache.get(animal_id)
+        if cached is not None:
+            weight_data, nutrition_data = cached
+            day, amount = row[0][:10], row[4]
+            if nutrition_data and nutrition_data[-1][0] == day:
+                nutrition_data = nutrition_data[:-1] + [(day, nutrition_data[-1][1] + amount)]
+            elif not nutrition_data or nutrition_data[-1][0] < day:
+                nutrition_data = nutrition_data + [(day, amount)]
+            else:
+                nutrition_data = None
+            if nutrition_data is None:
+                self._chart_cache.pop(animal_id)
+            else:
+                self._chart_cache[animal_id] = (weight_data, nutrition_data)
+                self.nutrition_chart.chart().append_total(nutrition_data)
+        self._dirty["dash"] = True
+
+        if self._dirty["diet"] or self._table_animal["diet"] != animal_id:
+            self._mark_dirty("diet")
+        else:
+            position = self.diet_model.insert_row(row)
+            self._ensure_current_loaded()
+            self._flash_table_row(self.diet_table, position)
+
     def _flash_table_row(self, table, row):
-        table.scrollToItem(table.item(row, 0))
-        for col in range(table.columnCount()):
-            item = table.item(row, col)
-            if item:
-                item.setBackground(QColor("#4CAF50"))
+        model = table.model()
+        if row >= model.rowCount():
+            return
+        table.scrollTo(model.index(row, 0))
+        model.set_row_background(row, self._FLASH_BRUSH)
         QTimer.singleShot(300, lambda: self._reset_table_colors(table, row))
 
     def _reset_table_colors(self, table, row):
-        for col in range(table.columnCount()):
-            item = table.item(row, col)
-            if item:
-                item.setBackground(QColor("#2E2E2E"))
+        table.model().set_row_background(row, None)
 
     def update_goal(self):
         try:
             self.nutrition_goal = float(self.goal_input.text())
-            self.load_data()
+            self._goal_timer.start()
         except ValueError:
             QMessageBox.warning(self, "Invalid Goal", "Please enter a valid number")
 
+    def _apply_goal(self):
+        # Only the nutrition chart shows the goal; a dirty dashboard picks it up on load
+        animal_id = self.current_animal_id()
+        if not self._dirty["dash"] and animal_id:
+            _, nutrition_data = self._dashboard_data(animal_id)
+            self.nutrition_chart.chart().update_chart(nutrition_data, self.nutrition_goal)
+
     def add_animal(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("Add Animal")
@@ -1280,227 +2093,260 @@ class KittenTracker(QMainWindow):
         dialog.setLayout(layout)
 
         if dialog.exec() == QDialog.DialogCode.Accepted and name_input.text().strip():
-            self.db._exec(
-                "INSERT INTO animals (name, animal_type, birthdate) VALUES (?, ?, ?)",
-                (name_input.text(), type_input.currentText(),
-                 birthdate_input.date().toString("yyyy-MM-dd"))
-            )
-            self._refresh_animal_list()
+            details = (name_input.text(), type_input.currentText(),
+                       birthdate_input.date().toString("yyyy-MM-dd"))
+            animal_id = self.db.add_animal(*details)
+            if animal_id is None:
+                return
+            # Append and select the new animal rather than re-listing them all
+            self.animal_combo.blockSignals(True)
+            self._add_animal_item(animal_id, *details)
+            self.animal_combo.setCurrentIndex(self.animal_combo.count() - 1)
+            self.animal_combo.blockSignals(False)
+            self.update_meal_types()
+            self.load_data()
 
     def _refresh_animal_list(self):
+        # Quiet while filling: the first addItem would select the animal
+        # before its details have been stored on the item
+        self.animal_combo.blockSignals(True)
         self.animal_combo.clear()
-        animals = self.db.conn.cursor().execute("SELECT id, name FROM animals").fetchall()
-        for animal_id, name in animals:
-            self.animal_combo.addItem(name, animal_id)
-        if animals:
+        for row in self.db.get_animal_details():
+            self._add_animal_item(*row)
+        self.animal_combo.blockSignals(False)
+        if self.animal_combo.count():
             self.animal_combo.setCurrentIndex(0)
+            self.update_meal_types()
             self.load_data()
 
+    def _add_animal_item(self, animal_id, name, animal_type, birthdate):
+        self.animal_combo.addItem(name, animal_id)
+        index = self.animal_combo.count() - 1
+        self.animal_combo.setItemData(index, animal_type, _ANIMAL_TYPE_ROLE)
+        self.animal_combo.setItemData(index, birthdate, _ANIMAL_BIRTHDATE_ROLE)
+
     def current_animal_id(self):
         if self.animal_combo.currentIndex() == -1:
             return None
         return self.animal_combo.currentData()
 
     def update_meal_types(self):
-        animal_id = self.current_animal_id()
-        if not animal_id:
-            return
-        row = self.db.conn.cursor().execute(
-            "SELECT animal_type FROM animals WHERE id=?", (animal_id,)
-        ).fetchone()
-        if not row:
+        if not self.current_animal_id():
             return
 
-        animal_type = row[0]
+        items = _MEAL_TYPES.get(self.animal_combo.currentData(_ANIMAL_TYPE_ROLE), _DEFAULT_MEAL_TYPES)
+        # Switching between animals of the same type keeps the user's pick
+        if items is self._meal_type_items:
+            return
+        self._meal_type_items = items
         self.meal_type.clear()
-        if animal_type == "Cat":
-            self.meal_type.addItems(["Wet Food 🐟", "Dry Food 🥣", "Treat 🍗", "Medicine 💊"])
-        elif animal_type == "Dog":
-            self.meal_type.addItems(["Kibble 🦴", "Raw Meat 🥩", "Dental Chew 🦷", "Puppy Formula"])
-        else:
-            self.meal_type.addItems(["Regular Meal", "Special Diet", "Vitamin", "Custom Feed"])
+        self.meal_type.addItems(items)
 
     def toggle_dev_mode(self, enabled):
         if enabled:
             QMessageBox.information(self, "Dev Mode On", "Now using dev DB.")
-            self.db.conn.close()
-            self.db = KittenDatabase(production=False)
+            if self._db_dev is None:
+                self._db_dev = KittenDatabase(production=False)
+            self.db = self._db_dev
         else:
             QMessageBox.information(self, "Dev Mode Off", "Now using production DB.")
-            self.db.conn.close()
-            self.db = KittenDatabase(production=True)
+            self.db = self._db_prod
+        self._chart_cache.clear()
         self._refresh_animal_list()
 
+    def closeEvent(self, event):
+        for db in (self._db_prod, self._db_dev):
+            if db is not None:
+                db.close()
+        super().closeEvent(event)
+
     def create_test_data(self):
         try:
-            self.db.clear_test_data()
-            cursor = self.db.conn.cursor()
+            self._chart_cache.clear()
 
-            # Insert a single test animal
-            cursor.execute(
-                "INSERT INTO animals (name, animal_type, birthdate) VALUES (?, ?, ?)",
-                ("Whiskers", "Cat", "2022-06-15")
-            )
-            animal_id = cursor.lastrowid
-
-            base_date = datetime.now() - timedelta(days=365)
-            max_weight = 4.2
-            growth_rate = 0.015
-            midpoint_day = 180
-            seasonal_amplitude = 0.15
-            weekly_noise = 0.03
-
-            for day in range(365):
-                logistic = max_weight / (1 + np.exp(-growth_rate * (day - midpoint_day)))
-                seasonal = 1 + seasonal_amplitude * np.sin(day / 58)
-                weekly = 1 + 0.05 * np.sin(day / 3.5)
-                noise = 1 + random.uniform(-weekly_noise, weekly_noise)
-                weight = logistic * seasonal * weekly * noise
-                date_str = (base_date + timedelta(days=day)).strftime("%Y-%m-%d")
-                note = self._generate_weight_note(day, weight)
-                self.db.add_weight(animal_id, date_str, round(weight, 3), note)
-
-            meal_types = {
-                "Morning Meal 🍳": {
-                    "times": (7, 9),
-                    "foods": [
-                        ("Chicken Pâté", 30, "Fancy Feast"),
-                        ("Salmon Flakes", 40, "Blue Buffalo"),
-                        ("Kitten Formula", 35, "Vet Recommended")
-                    ],
-                    "notes": [
-                        "Ate enthusiastically",
-                        "Left some crumbs",
-                        "Finished quickly",
-                        "Played with food first"
-                    ]
-                },
-                "Afternoon Snack 🥩": {
-                    "times": (12, 14),
-                    "foods": [
-                        ("Tuna Treat", 15, "Delectables"),
-                        ("Dental Chew", 10, "Greenies"),
-                        ("Chicken Jerky", 20, "PureBites")
-                    ],
-                    "notes": [
-                        "Midday munchies",
-                        "Shared with neighbor cat",
-                        "Ate while birdwatching",
-                        "Left some for later"
-                    ]
-                },
-                "Evening Feast 🍗": {
-                    "times": (17, 19),
-                    "foods": [
-                        ("Turkey Dinner", 60, "Wellness Core"),
-                        ("Salmon Supper", 55, "Instinct"),
-                        ("Weight Management", 50, "Hill's Science Diet")
-                    ],
-                    "notes": [
-                        "Cleaned the bowl!",
-                        "Begged for seconds",
-                        "Ate while purring",
-                        "Took a nap after"
-                    ]
-                },
-                "Night Cap 🥛": {
-                    "times": (21, 23),
-                    "foods": [
-                        ("Catnip Tea", 5, "Organic"),
-                        ("Lickable Treat", 10, "Churu"),
-                        ("Warm Goat Milk", 15, "Homemade")
-                    ],
-                    "notes": [
-                        "Bedtime ritual",
-                        "Midnight craving",
-                        "Dreamy nibbles",
-                        "Moonlight snack"
-                    ]
-                }
-            }
+            rng = np.random.default_rng()
+            start = np.datetime64(datetime.now().date() - timedelta(days=365))
+            date_strs = (start + np.arange(365)).astype(str).tolist()
 
-            special_dates = {
-                "2023-12-25": "Christmas Extra Treat! 🎄",
-                "2023-07-04": "Fireworks Anxiety Meal 💥",
-                "2023-10-31": "Halloween Pumpkin Mix 🎃",
-                "2023-03-17": "Green-Themed Food 🍀"
-            }
+            # One transaction (and one commit) for clearing the old data and
+            # loading the whole year, instead of a commit per row
+            with self.db.transaction() as cursor:
+                self.db.clear_test_data()
+                # Insert a single test animal
+                cursor.execute(_SQL_INSERT_ANIMAL, ("Whiskers", "Cat", "2022-06-15"))
+                animal_id = cursor.lastrowid
+                weight_rows = self._test_weight_rows(animal_id, date_strs, rng)
+                meal_rows = self._test_meal_rows(animal_id, date_strs, rng)
+
+                # Build the meal indexes once after the load rather than row by row.
+                # weight_data is clustered on its primary key, so it has no index to drop.
+                cursor.execute("DROP INDEX IF EXISTS idx_meals")
+                cursor.execute("DROP INDEX IF EXISTS idx_meals_day")
+                self.db.add_weights_bulk(weight_rows)
+                self.db.add_meals_bulk(meal_rows)
+                cursor.execute(_SQL_CREATE_MEAL_INDEX)
+                cursor.execute(_SQL_CREATE_MEAL_DAY_INDEX)
 
-            for day in range(365):
-                current_date = base_date + timedelta(days=day)
-                date_str = current_date.strftime("%Y-%m-%d")
-                special_note = special_dates.get(date_str, None)
-
-                for meal_name, details in meal_types.items():
-                    hour = random.randint(details["times"][0], details["times"][1])
-                    minute = random.randint(0, 59)
-                    food, base_amount, brand = random.choice(details["foods"])
-                    amount_variation = random.gauss(1, 0.1)
-                    amount = round(base_amount * amount_variation, 1)
-                    note_parts = [random.choice(details["notes"]), f"Weather: {self._random_weather()}"]
-                    if special_note:
-                        note_parts.append(special_note)
-                    final_notes = " | ".join(note_parts)
-
-                    timestamp = current_date.replace(hour=hour, minute=minute).strftime("%Y-%m-%d %H:%M:%S")
-                    self.db.add_meal(
-                        animal_id, timestamp, meal_name, food, brand, amount, notes=final_notes
-                    )
-
-                if date_str == "2023-06-15":
-                    self.db.add_meal(
-                        animal_id,
-                        current_date.replace(hour=12, minute=0).strftime("%Y-%m-%d %H:%M:%S"),
-                        "Birthday Feast 🎂",
-                        "Special Salmon Cake",
-                        "Homemade",
-                        80,
-                        "1st birthday celebration! 🥳"
-                    )
-
-            self.db.conn.commit()
             self._refresh_animal_list()
             self.load_data()
             QMessageBox.information(self, "Test Data Created", "Inserted 1-year cat data successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Test data failed: {str(e)}")
 
-    def _generate_weight_note(self, day, weight):
-        milestones = {
-            30: "First month growth",
-            90: "3-month adolescent surge",
-            180: "6-month teenage phase",
-            270: "9-month young adult",
-            365: "1-year anniversary"
-        }
-        if day in milestones:
-            return f"{milestones[day]} | Weight: {weight:.2f}kg"
-
-        events = [
-            ("Discovered birds", 0.15),
-            ("New food introduced", 0.1),
-            ("Playtime increase", 0.1),
-            ("Vet visit", 0.05),
-            ("Grooming session", 0.08)
+    def _test_weight_rows(self, animal_id, date_strs, rng):
+        max_weight = 4.2
+        growth_rate = 0.015
+        midpoint_day = 180
+        seasonal_amplitude = 0.15
+        weekly_noise = 0.03
+
+        days = np.arange(len(date_strs))
+        logistic = max_weight / (1 + np.exp(-growth_rate * (days - midpoint_day)))
+        seasonal = 1 + seasonal_amplitude * np.sin(days / 58)
+        weekly = 1 + 0.05 * np.sin(days / 3.5)
+        noise = 1 + rng.uniform(-weekly_noise, weekly_noise, days.size)
+        weights = logistic * seasonal * weekly * noise
+        rounded_weights = np.round(weights, 3)
+
+        # One draw per day against the cumulative odds, resolved in one searchsorted
+        events = np.searchsorted(_WEIGHT_EVENT_CUTOFFS, rng.random(days.size), side="right")
+        notes = [
+            self._generate_weight_note(day, weight, event)
+            for day, (weight, event) in enumerate(zip(weights.tolist(), events.tolist()))
         ]
-        for event, prob in events:
-            if random.random() < prob:
-                return f"{event} | Weight: {weight:.2f}kg"
+        # Dates come from a day range, so every (animal_id, date) key is unique
+        return list(zip([animal_id] * len(date_strs), date_strs, rounded_weights.tolist(), notes))
+
+    def _test_meal_rows(self, animal_id, date_strs, rng):
+        meal_types = {
+            "Morning Meal 🍳": {
+                "times": (7, 9),
+                "foods": [
+                    ("Chicken Pâté", 30, "Fancy Feast"),
+                    ("Salmon Flakes", 40, "Blue Buffalo"),
+                    ("Kitten Formula", 35, "Vet Recommended")
+                ],
+                "notes": [
+                    "Ate enthusiastically",
+                    "Left some crumbs",
+                    "Finished quickly",
+                    "Played with food first"
+                ]
+            },
+            "Afternoon Snack 🥩": {
+                "times": (12, 14),
+                "foods": [
+                    ("Tuna Treat", 15, "Delectables"),
+                    ("Dental Chew", 10, "Greenies"),
+                    ("Chicken Jerky", 20, "PureBites")
+                ],
+                "notes": [
+                    "Midday munchies",
+                    "Shared with neighbor cat",
+                    "Ate while birdwatching",
+                    "Left some for later"
+                ]
+            },
+            "Evening Feast 🍗": {
+                "times": (17, 19),
+                "foods": [
+                    ("Turkey Dinner", 60, "Wellness Core"),
+                    ("Salmon Supper", 55, "Instinct"),
+                    ("Weight Management", 50, "Hill's Science Diet")
+                ],
+                "notes": [
+                    "Cleaned the bowl!",
+                    "Begged for seconds",
+                    "Ate while purring",
+                    "Took a nap after"
+                ]
+            },
+            "Night Cap 🥛": {
+                "times": (21, 23),
+                "foods": [
+                    ("Catnip Tea", 5, "Organic"),
+                    ("Lickable Treat", 10, "Churu"),
+                    ("Warm Goat Milk", 15, "Homemade")
+                ],
+                "notes": [
+                    "Bedtime ritual",
+                    "Midnight craving",
+                    "Dreamy nibbles",
+                    "Moonlight snack"
+                ]
+            }
+        }
+
+        special_dates = {
+            "2023-12-25": "Christmas Extra Treat! 🎄",
+            "2023-07-04": "Fireworks Anxiety Meal 💥",
+            "2023-10-31": "Halloween Pumpkin Mix 🎃",
+            "2023-03-17": "Green-Themed Food 🍀"
+        }
+
+        n_days = len(date_strs)
+        # Draw every random value for the year up front, one array per meal slot
+        draws = {}
+        for meal_name, details in meal_types.items():
+            lo, hi = details["times"]
+            draws[meal_name] = (
+                rng.integers(lo, hi + 1, n_days).tolist(),
+                rng.integers(0, 60, n_days).tolist(),
+                rng.integers(0, len(details["foods"]), n_days).tolist(),
+                rng.integers(0, len(details["notes"]), n_days).tolist(),
+                rng.normal(1.0, 0.1, n_days).tolist()
+            )
+
+        weather = iter(self._random_weather(n_days * len(meal_types), rng))
+
+        meal_rows = []
+        for day, date_str in enumerate(date_strs):
+            special_note = special_dates.get(date_str, None)
+
+            for meal_name, details in meal_types.items():
+                hours, minutes, food_idx, note_idx, amount_var = draws[meal_name]
+                hour = hours[day]
+                minute = minutes[day]
+                food, base_amount, brand = details["foods"][food_idx[day]]
+                amount = round(base_amount * amount_var[day], 1)
+                note_parts = [details["notes"][note_idx[day]], f"Weather: {next(weather)}"]
+                if special_note:
+                    note_parts.append(special_note)
+                final_notes = " | ".join(note_parts)
+
+                timestamp = f"{date_str} {hour:02d}:{minute:02d}:00"
+                meal_rows.append(
+                    (animal_id, timestamp, meal_name, food, brand, amount, final_notes)
+                )
+
+            if date_str == "2023-06-15":
+                meal_rows.append((
+                    animal_id,
+                    f"{date_str} 12:00:00",
+                    "Birthday Feast 🎂",
+                    "Special Salmon Cake",
+                    "Homemade",
+                    80,
+                    "1st birthday celebration! 🥳"
+                ))
+        return meal_rows
+
+    def _generate_weight_note(self, day, weight, event):
+        """event indexes _WEIGHT_EVENTS; len(_WEIGHT_EVENTS) means none fired."""
+        if day in _WEIGHT_MILESTONES:
+            return f"{_WEIGHT_MILESTONES[day]} | Weight: {weight:.2f}kg"
+
+        if event < len(_WEIGHT_EVENTS):
+            return f"{_WEIGHT_EVENTS[event][0]} | Weight: {weight:.2f}kg"
         return f"Daily check | Weight: {weight:.2f}kg"
 
-    def _random_weather(self):
-        seasons = [
-            ("❄️ Winter", ["Snowy", "Frigid", "Icy", "Crisp"]),
-            ("🌱 Spring", ["Rainy", "Misty", "Sunny", "Breezy"]),
-            ("☀️ Summer", ["Hot", "Humid", "Stormy", "Dry"]),
-            ("🍂 Fall", ["Cool", "Windy", "Foggy", "Chilly"])
-        ]
-        season_idx = (datetime.now().month % 12) // 3
-        season = seasons[season_idx]
-        return f"{season[0]} - {random.choice(season[1])}"
+    def _random_weather(self, count, rng):
+        season_label, options = _SEASONS[(datetime.now().month % 12) // 3]
+        return [f"{season_label} - {choice}" for choice in rng.choice(options, count).tolist()]
 
     def clear_test_data(self):
         self.db.clear_test_data()
+        self._chart_cache.clear()
         self.load_data()
         QMessageBox.information(self, "Data Cleared", "All test data was removed from the current DB.")
 
@@ -1516,10 +2362,15 @@ class KittenTracker(QMainWindow):
         filename = f"weight_data_{animal_id}.csv"
         csv_path = self.db.get_data_folder() / filename
 
-        with open(csv_path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow(['Date', 'Weight', 'Notes'])
-            writer.writerows(self.db.get_weight_data(animal_id))
+        # Rows stream from the cursor straight into the writer
+        try:
+            with open(csv_path, 'w', newline='', buffering=1 << 20) as f:
+                writer = csv.writer(f, dialect='excel')
+                writer.writerow(['Date', 'Weight', 'Notes'])
+                writer.writerows(self.db.iter_weight_data(animal_id))
+        except OSError as e:
+            QMessageBox.warning(self, "Export Failed", f"Could not write {filename}: {e}")
+            return
 
         box = QMessageBox()
         box.setWindowTitle("Export Complete")
@@ -1533,13 +2384,7 @@ class KittenTracker(QMainWindow):
 
         if box.clickedButton() == open_folder:
             # Attempt to open the folder containing the CSV
-            folder = self.db.get_data_folder()
-            if platform.system() == "Windows":
-                os.startfile(folder)
-            elif platform.system() == "Darwin":
-                subprocess.run(["open", folder])
-            else:
-                subprocess.run(["xdg-open", folder])
+            _open_folder(self.db.get_data_folder())
 
 
 
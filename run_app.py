@@ -1,23 +1,71 @@
 #!/usr/bin/env python3
 
+import os
 import subprocess
 import sys
 from pathlib import Path
 
 APP_DIR = Path(__file__).resolve().parent
+PULL_LOG = APP_DIR / "git_pull.log"
 
 
 def update_repo():
-    """Pull the latest changes for the application repo."""
+    """
+    Start pulling the latest changes for the application repo in the
+    background; its output goes to PULL_LOG. Call it only once the app code
+    has been loaded, so the pull cannot change pawgress.py under a starting
+    app and only takes effect on the next start.
+    """
+    if os.environ.get("PAWGRESS_SKIP_PULL") == "1":
+        return
+    if not (APP_DIR / ".git").is_dir():
+        return
     try:
-        subprocess.run(["git", "pull"], cwd=APP_DIR, check=True)
+        with open(PULL_LOG, "w") as log:
+            subprocess.Popen(
+                ["git", "pull"],
+                cwd=APP_DIR,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                # Fail instead of waiting on a credential prompt nobody sees
+                env={**os.environ, "GIT_TERMINAL_PROMPT": "0"},
+            )
     except Exception as exc:
         print(f"Repository update failed: {exc}")
 
 
-def main():
+def launch_in_process(args):
+    """Run the app in this interpreter, skipping a second Python and PyQt6 start."""
+    # pawgress looks for legacy files relative to the working directory
+    os.chdir(APP_DIR)
+    sys.path.insert(0, str(APP_DIR))
+    from PyQt6.QtWidgets import QApplication
+    from pawgress import KittenTracker
+
+    # Only pull once pawgress is imported, so git cannot rewrite it mid-import
+    update_repo()
+    app = QApplication([sys.argv[0], *args])
+    window = KittenTracker()
+    window.show()
+    return app.exec()
+
+
+def launch_subprocess(args):
+    """Run pawgress.py in a fresh interpreter, leaving this one's modules alone."""
+    returncode = subprocess.run([sys.executable, str(APP_DIR / "pawgress.py"), *args], cwd=APP_DIR).returncode
+    # There is no telling when the child has finished reading pawgress.py, so
+    # pull once it has exited
     update_repo()
-    subprocess.run([sys.executable, str(APP_DIR / "pawgress.py"), *sys.argv[1:]], cwd=APP_DIR)
+    return returncode
+
+
+def main():
+    args = sys.argv[1:]
+    if "--subprocess" in args:
+        args.remove("--subprocess")
+        sys.exit(launch_subprocess(args))
+    sys.exit(launch_in_process(args))
 
 
 if __name__ == "__main__":